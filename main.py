@@ -5,6 +5,7 @@ from src.api.auth_routes import router as auth_router
 from src.api.test_routes import router as test_router
 from src.api.seo_routes import router as seo_router
 from src.core.config import settings
+from src.services.oauth_service import close_http_client
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -28,6 +29,10 @@ app.include_router(router, prefix="/api/v1")
 app.include_router(auth_router)
 app.include_router(seo_router)
 
+@app.on_event("shutdown")
+async def shutdown_http_client():
+    await close_http_client()
+
 @app.get("/")
 async def root():
     return {"message": "YouTube Project API"}
@@ -173,7 +173,7 @@ async def validate_token(
     제공된 액세스 토큰이 유효한지 확인합니다.
     """
     try:
-        is_valid = oauth_service.validate_token(access_token)
+        is_valid = await oauth_service.validate_token(access_token)
         
         if is_valid:
             return {
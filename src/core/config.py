@@ -15,6 +15,7 @@ class Settings(BaseSettings):
     YOUTUBE_API_KEY: Optional[str] = None
     YOUTUBE_API_SERVICE_NAME: str = "youtube"
     YOUTUBE_API_VERSION: str = "v3"
+    GOOGLE_MAX_CONCURRENCY: int = 10  # Google API 동시 요청 상한
     
     # OAuth 2.0
     GOOGLE_CLIENT_ID: Optional[str] = None
@@ -1,4 +1,5 @@
 from supabase import create_client, Client
+from redis import asyncio as aioredis
 from src.core.config import settings
 from typing import Optional
 
@@ -22,4 +23,28 @@ class SupabaseClient:
             return self.connect()
         return self.client
 
-supabase_client = SupabaseClient()
\ No newline at end of file
+class RedisClient:
+    def __init__(self):
+        self.client: Optional[aioredis.Redis] = None
+        
+    def connect(self) -> aioredis.Redis:
+        if not settings.REDIS_URL:
+            raise ValueError("REDIS_URL must be set")
+            
+        if not self.client:
+            # 연결 실패 시 API 호출로 빠르게 넘어갈 수 있도록 짧은 타임아웃 사용
+            self.client = aioredis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5
+            )
+        return self.client
+    
+    def get_client(self) -> aioredis.Redis:
+        if not self.client:
+            return self.connect()
+        return self.client
+
+supabase_client = SupabaseClient()
+redis_client = RedisClient()
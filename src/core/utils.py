@@ -0,0 +1,13 @@
+from datetime import datetime
+import time
+
+# (생성 시각, ISO 문자열) - 초 단위로만 갱신
+_last_iso = (0.0, '')
+
+def now_isoformat() -> str:
+    """현재 시각의 ISO 문자열을 1초 단위로 캐시하여 반환합니다."""
+    global _last_iso
+    now = time.time()
+    if now - _last_iso[0] > 1.0:
+        _last_iso = (now, datetime.fromtimestamp(now).isoformat())
+    return _last_iso[1]
@@ -1,14 +1,19 @@
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import statistics
+import asyncio
 import logging
 from .youtube_data_api import YouTubeDataAPIService
+from ..core.utils import now_isoformat
 
 logger = logging.getLogger(__name__)
 
 class ChannelPerformanceAnalyzer:
     """채널 성과 분석을 위한 종합적인 메트릭 계산 서비스"""
     
+    # 종합 점수 가중치: 최근 성과, 비디오 품질, 일관성, 참여도 순
+    _SCORE_WEIGHTS = (0.4, 0.3, 0.2, 0.1)
+    
     def __init__(self):
         self.youtube_service = YouTubeDataAPIService()
     
@@ -64,28 +69,32 @@ class ChannelPerformanceAnalyzer:
                     'data': self._get_fallback_metrics(channel_data)
                 }
             
-            # 각 메트릭 계산
-            recent_performance = await self._calculate_recent_performance(
-                recent_videos, channel_data.get('statistics', {})
-            )
+            # 통계 필드를 한 번만 평탄화하여 이후 계산에서 직접 인덱싱
+            recent_videos = self._normalize_videos(recent_videos)
             
-            video_quality = self._calculate_video_quality_score(
-                recent_videos, channel_data.get('statistics', {})
+            # 각 메트릭 계산 (비동기 메트릭은 동시에 실행)
+            channel_stats = channel_data.get('statistics', {})
+            recent_performance, engagement = await asyncio.gather(
+                self._calculate_recent_performance(recent_videos, channel_stats),
+                self._calculate_engagement_rate(recent_videos)
             )
             
-            consistency = self._calculate_content_consistency(recent_videos)
+            video_quality = self._calculate_video_quality_score(recent_videos, channel_stats)
             
-            engagement = await self._calculate_engagement_rate(recent_videos)
+            consistency = self._calculate_content_consistency(recent_videos)
             
             # 성과 비교 분석 추가
             performance_comparison = self._analyze_performance_comparison(recent_videos)
             
             # 종합 점수 계산 (가중평균)
-            comprehensive_score = (
-                recent_performance['score'] * 0.4 +
-                video_quality['score'] * 0.3 +
-                consistency['score'] * 0.2 +
-                engagement['score'] * 0.1
+            metric_scores = (
+                recent_performance['score'],
+                video_quality['score'],
+                consistency['score'],
+                engagement['score']
+            )
+            comprehensive_score = sum(
+                score * weight for score, weight in zip(metric_scores, self._SCORE_WEIGHTS)
             )
             
             # 분석 기간 최종 결정
@@ -104,7 +113,7 @@ class ChannelPerformanceAnalyzer:
                     'performance_comparison': performance_comparison,
                     'analysis_period': analysis_period,
                     'videos_analyzed': len(recent_videos),
-                    'last_updated': datetime.now().isoformat()
+                    'last_updated': now_isoformat()
                 }
             }
             
@@ -132,6 +141,8 @@ class ChannelPerformanceAnalyzer:
             
             videos = videos_response.get('data', {}).get('videos', [])
             recent_videos = []
+            ok_ids = []
+            fail_ids = []
             
             cutoff_date = datetime.now() - timedelta(days=days)
             logger.info(f"Looking for videos after {cutoff_date.isoformat()}, found {len(videos)} total videos")
@@ -143,8 +154,6 @@ class ChannelPerformanceAnalyzer:
                     )
                     
                     if published_at >= cutoff_date:
-                        logger.info(f"Found recent video: {video.get('title', 'Unknown')} published at {published_at.isoformat()}")
-                        
                         # 비디오 통계 가져오기 시도
                         try:
                             stats = await self.youtube_service.get_video_statistics(
@@ -155,14 +164,15 @@ class ChannelPerformanceAnalyzer:
                                 video_data = stats.get('data', {})
                                 video_data.update(video)
                                 recent_videos.append(video_data)
-                                logger.info(f"Successfully got statistics for {video.get('video_id')}")
+                                ok_ids.append(video.get('video_id'))
                             else:
-                                logger.warning(f"Failed to get video statistics for {video.get('video_id')}: {stats.get('message')}")
+                                fail_ids.append(video.get('video_id'))
                                 # 통계 없이도 기본 정보는 추가 (임시 데이터로)
                                 video['statistics'] = {'view_count': 1000, 'like_count': 50, 'comment_count': 10}  # 임시 데이터
                                 recent_videos.append(video)
                         except Exception as stats_error:
-                            logger.error(f"Exception getting video statistics: {str(stats_error)}")
+                            logger.debug("Exception getting video statistics for %s: %s", video.get('video_id'), stats_error)
+                            fail_ids.append(video.get('video_id'))
                             # 통계 API 실패 시에도 기본 정보는 추가
                             video['statistics'] = {'view_count': 1000, 'like_count': 50, 'comment_count': 10}  # 임시 데이터
                             recent_videos.append(video)
@@ -171,7 +181,12 @@ class ChannelPerformanceAnalyzer:
                     logger.warning(f"Error processing video {video.get('video_id')}: {str(e)}")
                     continue
             
-            logger.info(f"Found {len(recent_videos)} recent videos out of {len(videos)} total videos")
+            logger.info(
+                "Recent video stats: %d ok, %d fail out of %d total videos",
+                len(ok_ids), len(fail_ids), len(videos)
+            )
+            if fail_ids:
+                logger.warning("Failed to get video statistics for: %s", fail_ids)
             return recent_videos
             
         except Exception as e:
@@ -194,6 +209,8 @@ class ChannelPerformanceAnalyzer:
             
             videos = videos_response.get('data', {}).get('videos', [])
             recent_videos = []
+            ok_ids = []
+            fail_ids = []
             
             # 요청된 개수만큼 처리
             for video in videos[:count]:
@@ -207,9 +224,9 @@ class ChannelPerformanceAnalyzer:
                         video_data = stats.get('data', {})
                         video_data.update(video)
                         recent_videos.append(video_data)
-                        logger.info(f"Successfully got statistics for {video.get('video_id')}")
+                        ok_ids.append(video.get('video_id'))
                     else:
-                        logger.warning(f"Failed to get video statistics for {video.get('video_id')}: {stats.get('message')}")
+                        fail_ids.append(video.get('video_id'))
                         # 통계 없이도 기본 정보는 추가 (임시 데이터로)
                         video['statistics'] = {'view_count': 5000, 'like_count': 100, 'comment_count': 50}
                         recent_videos.append(video)
@@ -218,30 +235,48 @@ class ChannelPerformanceAnalyzer:
                     logger.warning(f"Error processing video {video.get('video_id')}: {str(e)}")
                     continue
             
-            logger.info(f"Found {len(recent_videos)} videos by count (requested: {count})")
+            logger.info(
+                "Video stats by count: %d ok, %d fail out of %d (requested: %d)",
+                len(ok_ids), len(fail_ids), len(videos[:count]), count
+            )
+            if fail_ids:
+                logger.warning("Failed to get video statistics for: %s", fail_ids)
             return recent_videos
             
         except Exception as e:
             logger.error(f"Error getting recent videos by count: {str(e)}")
             return []
     
+    def _normalize_videos(self, videos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """비디오 목록을 메트릭 계산용 평탄한 구조로 정규화합니다."""
+        normalized = []
+        for video in videos:
+            stats = video.get('statistics') or {}
+            published_at = video.get('published_at') or ''
+            # 게시 시각은 여기서 한 번만 파싱하여 보관
+            try:
+                published_dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
+            except ValueError:
+                published_dt = None
+            normalized.append({
+                'video_id': video.get('video_id'),
+                'title': video.get('title') or '',
+                'published_at': published_at,
+                'published_dt': published_dt,
+                'view_count': int(stats.get('view_count', 0) or 0),
+                'like_count': int(stats.get('like_count', 0) or 0),
+                'comment_count': int(stats.get('comment_count', 0) or 0)
+            })
+        return normalized
+    
     async def _calculate_recent_performance(self, recent_videos: List[Dict], channel_stats: Dict) -> Dict[str, Any]:
         """최근 영상 성과를 분석합니다."""
         if not recent_videos:
             return {'score': 0, 'value': 0, 'label': '데이터 없음'}
         
         try:
-            # 최근 영상들의 평균 조회수
-            view_counts = []
-            for video in recent_videos:
-                stats = video.get('statistics', {})
-                view_count = int(stats.get('view_count', 0))
-                view_counts.append(view_count)
-            
-            if not view_counts:
-                return {'score': 0, 'value': 0, 'label': '조회수 데이터 없음'}
-            
-            avg_recent_views = statistics.mean(view_counts)
+            # 최근 영상들의 평균 조회수 (중간 리스트 없이 계산)
+            avg_recent_views = statistics.fmean(video['view_count'] for video in recent_videos)
             subscriber_count = int(channel_stats.get('subscriber_count', 1))
             
             # 구독자 1명당 평균 조회수 (퍼센테이지)
@@ -274,10 +309,9 @@ class ChannelPerformanceAnalyzer:
             # 각 비디오의 성과 점수 계산
             video_scores = []
             for video in recent_videos:
-                stats = video.get('statistics', {})
-                view_count = int(stats.get('view_count', 0))
-                like_count = int(stats.get('like_count', 0))
-                comment_count = int(stats.get('comment_count', 0))
+                view_count = video['view_count']
+                like_count = video['like_count']
+                comment_count = video['comment_count']
                 
                 if view_count > 0:
                     # 구독자 대비 조회수 비율
@@ -323,33 +357,26 @@ class ChannelPerformanceAnalyzer:
             return {'score': 0, 'value': 0, 'label': '데이터 부족'}
         
         try:
-            # 업로드 간격 계산
-            upload_dates = []
-            for video in recent_videos:
-                try:
-                    published_at = datetime.fromisoformat(
-                        video.get('published_at', '').replace('Z', '+00:00')
-                    )
-                    upload_dates.append(published_at)
-                except:
-                    continue
+            # 업로드 간격 계산 (정규화 단계에서 파싱된 게시 시각 사용)
+            upload_dates = sorted(
+                video['published_dt'] for video in recent_videos
+                if video['published_dt'] is not None
+            )
             
             if len(upload_dates) < 2:
                 return {'score': 0, 'value': 0, 'label': '날짜 데이터 부족'}
             
-            upload_dates.sort()
-            
-            # 업로드 간격 (일)
-            intervals = []
-            for i in range(1, len(upload_dates)):
-                interval = (upload_dates[i-1] - upload_dates[i]).days
-                intervals.append(abs(interval))
+            # 업로드 간격 (일, 게시 시각 차이의 timedelta.days 기준)
+            intervals = [
+                abs((earlier - later).days)
+                for earlier, later in zip(upload_dates, upload_dates[1:])
+            ]
             
             if not intervals:
                 return {'score': 0, 'value': 0, 'label': '간격 계산 불가'}
             
             # 일관성 점수 계산 (간격의 표준편차가 작을수록 높은 점수)
-            avg_interval = statistics.mean(intervals)
+            avg_interval = statistics.fmean(intervals)
             
             if len(intervals) > 1:
                 std_deviation = statistics.stdev(intervals)
@@ -379,14 +406,9 @@ class ChannelPerformanceAnalyzer:
             total_comments = 0
             
             for video in recent_videos:
-                stats = video.get('statistics', {})
-                views = int(stats.get('view_count', 0))
-                likes = int(stats.get('like_count', 0))
-                comments = int(stats.get('comment_count', 0))
-                
-                total_views += views
-                total_likes += likes
-                total_comments += comments
+                total_views += video['view_count']
+                total_likes += video['like_count']
+                total_comments += video['comment_count']
             
             if total_views == 0:
                 return {'score': 0, 'value': 0, 'label': '조회수 없음'}
@@ -424,10 +446,9 @@ class ChannelPerformanceAnalyzer:
             # 각 비디오의 성과 점수 계산
             video_performances = []
             for video in recent_videos:
-                stats = video.get('statistics', {})
-                view_count = int(stats.get('view_count', 0))
-                like_count = int(stats.get('like_count', 0))
-                comment_count = int(stats.get('comment_count', 0))
+                view_count = video['view_count']
+                like_count = video['like_count']
+                comment_count = video['comment_count']
                 
                 # 참여도 계산
                 engagement_rate = ((like_count + comment_count) / max(view_count, 1)) * 100
@@ -442,11 +463,11 @@ class ChannelPerformanceAnalyzer:
                     'performance_score': performance_score
                 })
             
-            # 성과순 정렬
-            video_performances.sort(key=lambda x: x['performance_score'], reverse=True)
-            
-            best_video = video_performances[0]
-            worst_video = video_performances[-1]
+            # 최고/최저만 필요하므로 정렬 대신 한 번씩 선형 탐색
+            # (동점은 내림차순 안정 정렬의 처음/마지막과 같도록 최저는 역순으로 탐색)
+            performance_key = lambda x: x['performance_score']
+            best_video = max(video_performances, key=performance_key)
+            worst_video = min(reversed(video_performances), key=performance_key)
             
             # 성과 격차 계산
             performance_gap = ((best_video['performance_score'] - worst_video['performance_score']) / 
@@ -472,26 +493,26 @@ class ChannelPerformanceAnalyzer:
                 insights.append("참여도가 비교적 일정함")
             
             # 제목 분석
-            best_title_length = len(best_video['video'].get('title', ''))
-            worst_title_length = len(worst_video['video'].get('title', ''))
+            best_title_length = len(best_video['video']['title'])
+            worst_title_length = len(worst_video['video']['title'])
             
             if abs(best_title_length - worst_title_length) > 20:
                 insights.append(f"성과 좋은 영상 제목 길이: {best_title_length}자")
             
             return {
                 'best_video': {
-                    'title': best_video['video'].get('title', '제목 없음'),
-                    'video_id': best_video['video'].get('video_id'),
+                    'title': best_video['video']['title'] or '제목 없음',
+                    'video_id': best_video['video']['video_id'],
                     'view_count': best_video['view_count'],
                     'engagement_rate': best_video['engagement_rate'],
-                    'published_at': best_video['video'].get('published_at')
+                    'published_at': best_video['video']['published_at']
                 },
                 'worst_video': {
-                    'title': worst_video['video'].get('title', '제목 없음'),
-                    'video_id': worst_video['video'].get('video_id'),
+                    'title': worst_video['video']['title'] or '제목 없음',
+                    'video_id': worst_video['video']['video_id'],
                     'view_count': worst_video['view_count'],
                     'engagement_rate': worst_video['engagement_rate'],
-                    'published_at': worst_video['video'].get('published_at')
+                    'published_at': worst_video['video']['published_at']
                 },
                 'performance_gap': round(performance_gap, 1),
                 'insights': insights
@@ -541,5 +562,5 @@ class ChannelPerformanceAnalyzer:
             },
             'analysis_period': '데이터 부족',
             'videos_analyzed': 0,
-            'last_updated': datetime.now().isoformat()
+            'last_updated': now_isoformat()
         }
\ No newline at end of file
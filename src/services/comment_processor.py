@@ -1,13 +1,102 @@
 from typing import List, Dict, Tuple, Set, Optional
 import re
-import hashlib
 from collections import defaultdict, Counter
-from difflib import SequenceMatcher
+from functools import lru_cache
+from itertools import groupby
 import logging
+import math
+from rapidfuzz import fuzz, process
 from .url_spam_detector import URLSpamDetector
 
 logger = logging.getLogger(__name__)
 
+SHINGLE_SIZE = 2  # 유사 댓글 후보 탐색용 문자 n-gram 크기 (bigram이어야 후보가 빠짐없이 나옴)
+
+# 전처리 및 스팸 패턴 정규식 (모듈 로드 시 한 번만 컴파일)
+_NONWORD_RE = re.compile(r'[^\w\sㄱ-ㅎㅏ-ㅣ가-힣]')
+_WS_RE = re.compile(r'\s+')
+_WORD_RE = re.compile(r'\w+')
+_EMOJI_RE = re.compile(r'^[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF\s]*$')
+_LINK_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+
+# ASCII 전용 텍스트용 삭제 테이블 (영문, 숫자, 밑줄, 공백 문자만 유지)
+_ASCII_STRIP_TABLE = {
+    code: None for code in range(128)
+    if not (chr(code).isalnum() or chr(code) == '_' or chr(code).isspace())
+}
+
+@lru_cache(maxsize=65536)
+def _normalize_text(text: str) -> str:
+    """텍스트 정규화 (동일 텍스트는 캐시된 결과 재사용)"""
+    if text.isascii():
+        # 한글이 없는 텍스트는 정규식 대신 translate + split으로 처리
+        return ' '.join(text.lower().translate(_ASCII_STRIP_TABLE).split())
+    
+    # 소문자 변환 후 특수문자 및 이모지 제거 (한글, 영문, 숫자, 공백만 유지),
+    # 연속된 공백을 하나로 변환하고 앞뒤 공백 제거
+    return _WS_RE.sub(' ', _NONWORD_RE.sub('', text.lower())).strip()
+
+def _is_emoji_only(text: str) -> bool:
+    """이모지(및 공백)만으로 이루어진 댓글인지 여부"""
+    if text.isascii():
+        # ASCII 텍스트에는 이모지가 없으므로 공백뿐인 경우만 해당
+        return not text.strip()
+    return _EMOJI_RE.match(text) is not None
+
+def _contains_link(text: str) -> bool:
+    """링크 포함 여부 (정규식 앞에 리터럴 접두어 검사로 대부분의 댓글을 걸러냄)"""
+    return 'http' in text and _LINK_RE.search(text) is not None
+
+def _shingles(text: str) -> Set[str]:
+    """정규화된 텍스트를 문자 n-gram 집합으로 분할"""
+    if len(text) <= SHINGLE_SIZE:
+        return {text} if text else set()
+    return {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+def _short_pair_limit(threshold: float) -> float:
+    """bigram을 하나도 공유하지 않고도 유사도 기준을 넘을 수 있는 두 텍스트 길이 합의 상한
+    
+    ratio = 2*LCS/(l1+l2) 이고, LCS 중 두 텍스트 모두에서 연속인 bigram은 최소
+    3*LCS - (l1+l2) - 1 >= (1.5*threshold - 1)*(l1+l2) - 1 개입니다.
+    이 값이 양수가 아닌 짧은 쌍(기준 0.8이면 길이 합 5 이하)은 전체 비교가 필요합니다.
+    """
+    slack = 1.5 * threshold - 1
+    if slack <= 0:
+        return math.inf  # bigram 공유가 보장되지 않으므로 모든 쌍을 비교
+    return 1 / slack + 1e-9
+
+class _SimilarityIndex:
+    """정규화 텍스트의 bigram 역색인
+    
+    유사도가 threshold 이상일 수 있는 후보는 bigram을 공유하거나 길이 합이 짧은
+    텍스트뿐이므로, 두 경우를 합쳐 후보를 빠짐없이 반환합니다.
+    """
+    
+    def __init__(self, threshold: float):
+        self.short_pair_limit = _short_pair_limit(threshold)
+        self._shingle_index: Dict[str, List[int]] = defaultdict(list)
+        self._short_texts: List[Tuple[int, int]] = []  # (길이, 항목 인덱스)
+    
+    def add(self, index: int, text: str) -> None:
+        """항목 인덱스로 텍스트 색인 (빈 텍스트는 어떤 텍스트와도 유사하지 않음)"""
+        if not text:
+            return
+        for shingle in _shingles(text):
+            self._shingle_index[shingle].append(index)
+        if len(text) < self.short_pair_limit:
+            self._short_texts.append((len(text), index))
+    
+    def candidates(self, text: str) -> List[int]:
+        """유사도 기준을 넘을 수 있는 항목 인덱스 (오름차순)"""
+        found = {
+            index
+            for shingle in _shingles(text)
+            for index in self._shingle_index.get(shingle, ())
+        }
+        length_limit = self.short_pair_limit - len(text)
+        found.update(index for length, index in self._short_texts if length <= length_limit)
+        return sorted(found)
+
 class CommentProcessor:
     """댓글 전처리 및 매크로 탐지 서비스"""
     
@@ -15,30 +104,25 @@ class CommentProcessor:
         self.similarity_threshold = 0.8  # 유사도 임계값
         self.min_duplicate_count = 3    # 최소 중복 개수
         self.url_spam_detector = URLSpamDetector()  # URL 스팸 탐지기
+        # 스팸 물결에서 반복되는 (텍스트, 작성자) 조합의 URL 분석 결과 캐시
+        # (캐시된 결과는 요청 간에 공유되므로 내부에서는 읽기만 하고, 응답에 넣을 때는 복사본 사용)
+        self._analyze_url_spam = lru_cache(maxsize=10000)(self.url_spam_detector.analyze_comment)
         
     def preprocess_text(self, text: str) -> str:
         """텍스트 전처리 (정규화)"""
         if not text:
             return ""
-            
-        # 소문자 변환
-        text = text.lower()
         
-        # 특수문자 및 이모지 제거 (한글, 영문, 숫자, 공백만 유지)
-        text = re.sub(r'[^\w\sㄱ-ㅎㅏ-ㅣ가-힣]', '', text)
-        
-        # 연속된 공백을 하나로 변환
-        text = re.sub(r'\s+', ' ', text)
-        
-        # 앞뒤 공백 제거
-        text = text.strip()
-        
-        return text
+        # 한 파이프라인에서 같은 댓글이 여러 번 정규화되므로 캐시를 거침
+        return _normalize_text(text)
     
-    def calculate_text_hash(self, text: str) -> str:
-        """텍스트의 해시값 계산 (완전히 동일한 댓글 탐지용)"""
+    def calculate_text_hash(self, text: str) -> int:
+        """텍스트의 해시값 계산 (완전히 동일한 댓글 탐지용)
+        
+        그룹핑 키로만 쓰이므로 암호학적 해시 대신 내장 64비트 해시를 사용합니다.
+        """
         normalized_text = self.preprocess_text(text)
-        return hashlib.md5(normalized_text.encode('utf-8')).hexdigest()
+        return hash(normalized_text)
     
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """두 텍스트 간의 유사도 계산 (0~1)"""
@@ -48,51 +132,110 @@ class CommentProcessor:
         normalized_text1 = self.preprocess_text(text1)
         normalized_text2 = self.preprocess_text(text2)
         
+        return self._normalized_similarity(normalized_text1, normalized_text2)
+    
+    def _normalized_similarity(self, normalized_text1: str, normalized_text2: str) -> float:
+        """이미 정규화된 두 텍스트 간의 유사도 계산 (0~1)"""
         if not normalized_text1 or not normalized_text2:
             return 0.0
         
-        return SequenceMatcher(None, normalized_text1, normalized_text2).ratio()
-    
-    def detect_exact_duplicates(self, comments: List[Dict]) -> Dict[str, List[Dict]]:
-        """완전히 동일한 댓글 탐지"""
-        hash_groups = defaultdict(list)
-        
-        for comment in comments:
-            text_hash = self.calculate_text_hash(comment['text'])
-            hash_groups[text_hash].append(comment)
+        if normalized_text1 == normalized_text2:
+            return 1.0
         
-        # 중복이 발견된 그룹만 반환
-        duplicates = {
-            hash_key: group for hash_key, group in hash_groups.items()
-            if len(group) >= self.min_duplicate_count
-        }
-        
-        return duplicates
+        # RapidFuzz의 Indel 기반 ratio (0~100)를 0~1 범위로 변환
+        return fuzz.ratio(normalized_text1, normalized_text2) / 100.0
+    
+    def _matching_candidates(
+        self,
+        normalized_text: str,
+        candidate_texts: List[str],
+        score_cutoff: float
+    ) -> List[Tuple[int, float]]:
+        """후보 텍스트 중 유사도가 score_cutoff 이상인 (후보 위치, 유사도) 목록
+        
+        ratio의 상한은 2*min(len)/(len1+len2)이므로 길이 차이만으로 기준 미달인
+        후보는 제외하고, 나머지를 한 번의 RapidFuzz 배치 호출로 검증합니다.
+        결과는 후보 위치 오름차순으로 반환합니다.
+        """
+        if not normalized_text:
+            return []
+        
+        length = len(normalized_text)
+        viable = [
+            position for position, text in enumerate(candidate_texts)
+            if text and 2 * min(length, len(text)) >= score_cutoff * (length + len(text))
+        ]
+        if not viable:
+            return []
+        
+        matches = process.extract(
+            normalized_text,
+            [candidate_texts[position] for position in viable],
+            scorer=fuzz.ratio,
+            score_cutoff=score_cutoff * 100,
+            limit=None
+        )
+        return sorted((viable[index], score / 100.0) for _, score, index in matches)
+    
+    def detect_exact_duplicates(self, comments: List[Dict]) -> Dict[int, List[Dict]]:
+        """완전히 동일한 댓글 탐지
+        
+        해시 순으로 정렬한 인덱스를 한 번 순회하며 그룹을 만들고,
+        결과는 각 그룹이 처음 등장한 순서를 유지합니다.
+        """
+        hashes = [self.calculate_text_hash(comment['text']) for comment in comments]
+        order = sorted(range(len(comments)), key=hashes.__getitem__)
+        
+        # 중복이 발견된 그룹만 수집 (첫 등장 인덱스, 해시, 그룹)
+        found = []
+        for text_hash, indices in groupby(order, key=hashes.__getitem__):
+            indices = list(indices)
+            if len(indices) >= self.min_duplicate_count:
+                found.append((indices[0], text_hash, [comments[index] for index in indices]))
+        
+        found.sort(key=lambda item: item[0])
+        return {text_hash: group for _, text_hash, group in found}
     
     def detect_similar_duplicates(self, comments: List[Dict]) -> List[List[Dict]]:
-        """유사한 댓글 그룹 탐지"""
-        processed_comments = []
+        """유사한 댓글 그룹 탐지
+        
+        모든 그룹 대표와 비교하는 대신, 대표 텍스트의 bigram 역색인에서
+        기준을 넘을 수 있는 그룹만 후보로 골라 유사도를 검증합니다
+        (후보에서 빠지는 그룹은 기준 미달이 보장되므로 결과는 전체 비교와 같음).
+        """
         similar_groups = []
+        representative_texts = []  # 그룹별 대표 댓글의 정규화 텍스트
+        representative_groups = {}  # 대표 정규화 텍스트 -> 그룹 인덱스
+        representative_index = _SimilarityIndex(self.similarity_threshold)
         
-        for i, comment in enumerate(comments):
-            comment_added = False
+        for comment in comments:
+            normalized_text = self.preprocess_text(comment['text'])
             
-            # 기존 그룹들과 비교
-            for group in similar_groups:
-                # 그룹의 첫 번째 댓글과 유사도 비교
-                similarity = self.calculate_similarity(
-                    comment['text'], 
-                    group[0]['text']
-                )
-                
-                if similarity >= self.similarity_threshold:
-                    group.append(comment)
-                    comment_added = True
-                    break
+            # 대표 텍스트와 완전히 같으면 비교 없이 해당 그룹에 배정
+            # (그 대표가 앞선 그룹들과 유사하지 않았으므로 배정 결과는 동일)
+            if normalized_text in representative_groups:
+                similar_groups[representative_groups[normalized_text]].append(comment)
+                continue
+            
+            # 후보 그룹 중 기준을 넘는 가장 먼저 생성된 그룹에 배정
+            candidates = representative_index.candidates(normalized_text)
+            matches = self._matching_candidates(
+                normalized_text,
+                [representative_texts[group_index] for group_index in candidates],
+                self.similarity_threshold
+            )
+            
+            if matches:
+                similar_groups[candidates[matches[0][0]]].append(comment)
+                continue
             
             # 어떤 그룹에도 속하지 않으면 새 그룹 생성
-            if not comment_added:
-                similar_groups.append([comment])
+            new_index = len(similar_groups)
+            similar_groups.append([comment])
+            representative_texts.append(normalized_text)
+            if normalized_text:
+                representative_groups[normalized_text] = new_index
+            representative_index.add(new_index, normalized_text)
         
         # 최소 개수 이상의 댓글이 있는 그룹만 반환
         return [
@@ -125,67 +268,72 @@ class CommentProcessor:
         # 3. 의심스러운 작성자 분석 제거 (한 사람이 여러 댓글 다는 건 자연스러운 현상)
         patterns['suspicious_authors'] = []
         
-        # 4. 짧고 반복적인 댓글 (3글자 이하)
-        patterns['short_repetitive'] = sum(
-            1 for comment in comments 
-            if len(self.preprocess_text(comment['text'])) <= 3
-        )
-        
-        # 5. 이모지만 있는 댓글
-        emoji_pattern = re.compile(r'^[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF\s]*$')
-        patterns['emoji_spam'] = sum(
-            1 for comment in comments 
-            if emoji_pattern.match(comment['text'])
-        )
+        # 4~7. 짧은 댓글 / 이모지 / 링크 / 단어 빈도를 한 번의 순회로 집계
+        short_repetitive = 0
+        emoji_spam = 0
+        link_spam = 0
+        word_counts = Counter()
         
-        # 6. 링크가 포함된 댓글
-        link_pattern = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
-        patterns['link_spam'] = sum(
-            1 for comment in comments 
-            if link_pattern.search(comment['text'])
-        )
-        
-        # 7. 자주 등장하는 구문 분석
-        all_text = ' '.join(comment['text'] for comment in comments)
-        words = re.findall(r'\b\w+\b', all_text.lower())
-        word_counts = Counter(words)
+        for comment in comments:
+            text = comment['text']
+            normalized_text = self.preprocess_text(text)
+            
+            # 4. 짧고 반복적인 댓글 (3글자 이하)
+            if len(normalized_text) <= 3:
+                short_repetitive += 1
+            
+            # 5. 이모지만 있는 댓글
+            if _is_emoji_only(text):
+                emoji_spam += 1
+            
+            # 6. 링크가 포함된 댓글
+            if _contains_link(text):
+                link_spam += 1
+            
+            # 7. 자주 등장하는 구문 (원문을 단어 문자 단위로 분리, 정규화 텍스트는 구두점을
+            #    공백 없이 지워 'hello,world'가 한 단어가 되므로 사용하지 않음.
+            #    2글자 이하 단어는 집계 단계에서 제외해 상위 10개 자리를 차지하지 않도록 함)
+            word_counts.update(word for word in _WORD_RE.findall(text.lower()) if len(word) > 2)
+        
+        patterns['short_repetitive'] = short_repetitive
+        patterns['emoji_spam'] = emoji_spam
+        patterns['link_spam'] = link_spam
         patterns['common_phrases'] = [
             {'phrase': word, 'count': count}
             for word, count in word_counts.most_common(10)
-            if count >= 5 and len(word) > 2
+            if count >= 5
         ]
         
         # 8. URL 스팸 분석 - 통합 처리
         url_spam_comments = []
-        url_spam_by_id = {}  # 중복 방지용
+        # 댓글 ID별 URL 분석 결과 (입력 댓글을 변경하지 않고 대댓글 분석에서 재사용)
+        url_analyses = {}
         
         for comment in comments:
             comment_id = comment['comment_id']
             
             # 이미 처리된 댓글은 스킵
-            if comment_id in url_spam_by_id:
+            if comment_id in url_analyses:
                 continue
                 
-            url_analysis = self.url_spam_detector.analyze_comment(
+            url_analysis = self._analyze_url_spam(
                 comment['text'], 
                 comment['author']
             )
-            
-            # URL 분석 결과를 댓글에 저장 (나중에 재사용)
-            comment['_url_analysis'] = url_analysis
+            url_analyses[comment_id] = url_analysis
             
             if url_analysis.get('is_spam', False):
                 patterns['url_spam'] += 1
                 
-                # URL 스팸 상세 정보 구성
+                # URL 스팸 상세 정보 구성 (캐시된 분석 결과의 리스트/딕셔너리는 복사해서 응답에 포함)
                 url_spam_detail = {
                     'comment_id': comment_id,
                     'author': comment['author'],
                     'text': comment['text'][:100] + '...' if len(comment['text']) > 100 else comment['text'],
                     'spam_confidence': url_analysis.get('spam_confidence', 0),
-                    'detected_categories': url_analysis.get('risk_analysis', {}).get('detected_categories', []),
-                    'urls': url_analysis.get('urls', []),
-                    'youtube_info': url_analysis.get('youtube_info', []),
+                    'detected_categories': list(url_analysis.get('risk_analysis', {}).get('detected_categories', [])),
+                    'urls': [dict(url) for url in url_analysis.get('urls', [])],
+                    'youtube_info': [dict(info) for info in url_analysis.get('youtube_info', [])],
                     'is_reply': comment.get('is_reply', False),
                     'parent_id': comment.get('parent_id', None),
                     'like_count': comment.get('like_count', 0),
@@ -193,7 +341,6 @@ class CommentProcessor:
                 }
                 
                 url_spam_comments.append(url_spam_detail)
-                url_spam_by_id[comment_id] = url_spam_detail
                 
                 # 디버깅을 위한 로그 추가
                 logger.info(f"URL 스팸 탐지: {comment['author']} - {url_analysis.get('spam_confidence', 0)}% 확신")
@@ -201,13 +348,22 @@ class CommentProcessor:
         patterns['url_spam_details'] = url_spam_comments
         
         # 9. 대댓글 매크로 패턴 분석 (새로 추가)
-        reply_patterns = self._analyze_reply_patterns(comments)
+        reply_patterns = self._analyze_reply_patterns(comments, url_analyses)
         patterns.update(reply_patterns)
         
         return patterns
     
-    def _analyze_reply_patterns(self, comments: List[Dict]) -> Dict:
-        """대댓글 매크로 패턴 분석"""
+    def _analyze_reply_patterns(
+        self,
+        comments: List[Dict],
+        url_analyses: Optional[Dict[str, Dict]] = None
+    ) -> Dict:
+        """대댓글 매크로 패턴 분석
+        
+        url_analyses에 댓글 ID별 URL 분석 결과가 있으면 다시 분석하지 않습니다.
+        """
+        if url_analyses is None:
+            url_analyses = {}
         reply_patterns = {
             'reply_spam_count': 0,
             'reply_spam_details': [],
@@ -215,9 +371,14 @@ class CommentProcessor:
             'reply_duplicate_patterns': []
         }
         
-        # 대댓글만 필터링
-        replies = [comment for comment in comments if comment.get('is_reply', False)]
-        regular_comments = [comment for comment in comments if not comment.get('is_reply', False)]
+        # 대댓글과 일반 댓글을 한 번의 순회로 분리
+        replies = []
+        regular_comments = []
+        for comment in comments:
+            if comment.get('is_reply', False):
+                replies.append(comment)
+            else:
+                regular_comments.append(comment)
         
         if not replies:
             return reply_patterns
@@ -229,36 +390,51 @@ class CommentProcessor:
         reply_duplicates = self.detect_exact_duplicates(replies)
         reply_patterns['reply_duplicate_patterns'] = [
             {
-                'text_sample': list(group)[0]['text'],
+                'text_sample': group[0]['text'],
                 'duplicate_count': len(group),
-                'authors': list(set(comment['author'] for comment in group))
+                'authors': list({comment['author'] for comment in group})
             }
             for group in reply_duplicates.values()
         ]
         
+        # 일반 댓글 정규화 텍스트의 bigram 역색인 (동일 텍스트는 한 번만 색인)
+        regular_texts = list(dict.fromkeys(
+            self.preprocess_text(comment['text']) for comment in regular_comments
+        ))
+        regular_index = _SimilarityIndex(0.8)
+        for text_index, text in enumerate(regular_texts):
+            regular_index.add(text_index, text)
+        
         # 3. 대댓글 스팸 상세 분석 (댓글 개수 기반 판정 제거)
         reply_spam_details = []
         for reply in replies:
             spam_score = 0
             spam_indicators = []
+            normalized_reply = self.preprocess_text(reply['text'])
             
             # 매우 짧은 대댓글 (1-2글자)
-            if len(self.preprocess_text(reply['text'])) <= 2:
+            if len(normalized_reply) <= 2:
                 spam_score += 3
                 spam_indicators.append('very_short')
             
             # 대댓글에서 URL 스팸 체크
-            url_analysis = self.url_spam_detector.analyze_comment(reply['text'], reply['author'])
+            url_analysis = url_analyses.get(reply['comment_id'])
+            if url_analysis is None:
+                url_analysis = self._analyze_url_spam(reply['text'], reply['author'])
             if url_analysis.get('is_spam', False):
                 spam_score += 6
                 spam_indicators.append('url_spam')
             
-            # 대댓글에서 일반 댓글과 유사한 내용 반복
-            for regular_comment in regular_comments:
-                if self.calculate_similarity(reply['text'], regular_comment['text']) > 0.8:
-                    spam_score += 5
-                    spam_indicators.append('similar_to_main_comment')
-                    break
+            # 대댓글에서 일반 댓글과 유사한 내용 반복 (기준을 넘을 수 있는 후보만 검증)
+            candidates = regular_index.candidates(normalized_reply)
+            matches = self._matching_candidates(
+                normalized_reply,
+                [regular_texts[text_index] for text_index in candidates],
+                0.8
+            )
+            if any(similarity > 0.8 for _, similarity in matches):
+                spam_score += 5
+                spam_indicators.append('similar_to_main_comment')
             
             # 임계값을 높여서 더 확실한 스팸만 탐지 (URL 스팸이 있거나 중복 내용일 때만)
             if spam_score >= 5:
@@ -291,7 +467,7 @@ class CommentProcessor:
                         'text_sample': group[0]['text'],
                         'duplicate_count': len(group),
                         'comment_ids': [comment['comment_id'] for comment in group],
-                        'authors': list(set(comment['author'] for comment in group))
+                        'authors': list({comment['author'] for comment in group})
                     }
                     for group in exact_duplicates.values()
                 ]
@@ -303,47 +479,64 @@ class CommentProcessor:
                         'representative_text': group[0]['text'],
                         'similar_count': len(group),
                         'comment_ids': [comment['comment_id'] for comment in group],
-                        'authors': list(set(comment['author'] for comment in group)),
-                        'similarity_samples': [
-                            {
-                                'text': comment['text'],
-                                'similarity': self.calculate_similarity(group[0]['text'], comment['text'])
-                            }
-                            for comment in group[1:3]  # 처음 2개만 샘플로
-                        ]
+                        'authors': list({comment['author'] for comment in group}),
+                        'similarity_samples': self._similarity_samples(group)
                     }
                     for group in similar_groups
                 ]
             }
         }
     
-    def get_suspicious_comment_ids(self, comments: List[Dict]) -> List[str]:
-        """의심스러운 댓글 ID 목록 반환"""
+    def _similarity_samples(self, group: List[Dict]) -> List[Dict]:
+        """그룹 대표 댓글과 샘플 댓글(처음 2개) 간 유사도를 한 번의 배치 호출로 계산"""
+        samples = group[1:3]
+        if not samples:
+            return []
+        
+        matches = process.extract(
+            group[0]['text'],
+            [comment['text'] for comment in samples],
+            scorer=fuzz.ratio,
+            processor=self.preprocess_text,
+            limit=None
+        )
+        scores = {index: score / 100.0 for _, score, index in matches}
+        
+        return [
+            {'text': comment['text'], 'similarity': scores[index]}
+            for index, comment in enumerate(samples)
+        ]
+    
+    def get_suspicious_comment_ids(
+        self,
+        comments: List[Dict],
+        spam_patterns: Optional[Dict] = None,
+        duplicate_groups: Optional[Dict] = None
+    ) -> List[str]:
+        """의심스러운 댓글 ID 목록 반환
+        
+        이미 계산된 spam_patterns / duplicate_groups를 넘기면 분석을 다시 수행하지 않습니다.
+        """
         suspicious_ids = set()
         
+        if duplicate_groups is None:
+            duplicate_groups = self.get_duplicate_groups(comments)
+        if spam_patterns is None:
+            spam_patterns = self.analyze_spam_patterns(comments)
+        
         # 완전 중복 댓글 ID 수집
-        exact_duplicates = self.detect_exact_duplicates(comments)
-        for group in exact_duplicates.values():
-            for comment in group:
-                suspicious_ids.add(comment['comment_id'])
+        for group in duplicate_groups['exact_duplicates']['groups']:
+            suspicious_ids.update(group['comment_ids'])
         
         # 유사 댓글 그룹의 ID 수집
-        similar_groups = self.detect_similar_duplicates(comments)
-        for group in similar_groups:
-            for comment in group:
-                suspicious_ids.add(comment['comment_id'])
+        for group in duplicate_groups['similar_groups']['groups']:
+            suspicious_ids.update(group['comment_ids'])
         
-        # URL 스팸 댓글 ID 수집 (새로 추가)
-        for comment in comments:
-            url_analysis = self.url_spam_detector.analyze_comment(
-                comment['text'], 
-                comment['author']
-            )
-            if url_analysis.get('is_spam', False):
-                suspicious_ids.add(comment['comment_id'])
+        # URL 스팸 댓글 ID 수집 (analyze_spam_patterns 결과 재사용)
+        for url_spam in spam_patterns.get('url_spam_details', []):
+            suspicious_ids.add(url_spam['comment_id'])
         
-        # 대댓글 스팸 ID 수집 (새로 추가)
-        spam_patterns = self.analyze_spam_patterns(comments)
+        # 대댓글 스팸 ID 수집
         for reply_spam in spam_patterns.get('reply_spam_details', []):
             suspicious_ids.add(reply_spam['comment_id'])
         
@@ -362,7 +555,7 @@ class CommentProcessor:
         
         spam_patterns = self.analyze_spam_patterns(comments)
         duplicate_groups = self.get_duplicate_groups(comments)
-        suspicious_ids = self.get_suspicious_comment_ids(comments)
+        suspicious_ids = self.get_suspicious_comment_ids(comments, spam_patterns, duplicate_groups)
         
         return {
             'total_comments': len(comments),
@@ -1,15 +1,262 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, NamedTuple
+import asyncio
+import json
 import logging
+import re
+import time
+import unicodedata
 from datetime import datetime, timedelta
+from functools import lru_cache
+from collections import Counter
+from itertools import chain
+from src.core.database import redis_client
 from src.services.youtube_data_api import YouTubeDataAPIService
+from src.core.utils import now_isoformat
 
 logger = logging.getLogger(__name__)
 
+# YouTube Data API 동시 실행 요청 상한 (할당량 버스트 방지)
+MAX_CONCURRENT_API_CALLS = 8
+
+# 채널 정보 캐시 설정
+CHANNEL_INFO_CACHE_TTL = 3600  # 초
+CHANNEL_INFO_CACHE_SIZE = 1024
+
+# Redis 영구 캐시 설정 (재시작 후에도 API 할당량 절약)
+PERSISTENT_CACHE_TTL = 86400  # 초
+PERSISTENT_CACHE_RETRY_DELAY = 60  # Redis 장애 시 재시도까지 대기 (초)
+
+# 키워드 추출용 상수
+_KEYWORD_CLEAN_RE = re.compile(r'[^\w-]|_')  # 문자/숫자와 하이픈만 유지
+_COMMON_WORDS = frozenset({'채널', '구독', '좋아요', '댓글', '영상', '비디오', 'channel', 'subscribe', 'like', 'comment', 'video'})
+# NFKC 이후에도 남는 인용부호/대시 변형 통일
+_KEYWORD_PUNCT_TABLE = str.maketrans({
+    '\u2018': "'", '\u2019': "'", '\u201c': '"', '\u201d': '"',
+    '\u2013': '-', '\u2014': '-'
+})
+
+# 제목 패턴 분석용 상수
+_TITLE_EMOJIS = frozenset('✨🔥❤💎⭐')
+_TITLE_PUNCTUATION = frozenset('!?')
+_NOVELTY_WORDS = ('NEW', '신작', '최신', '업데이트')
+
+# Wikipedia 주제 키워드 -> 한국어 키워드 매핑
+_TOPIC_KEYWORD_MAP = {
+    'Video game': '게임',
+    'Music': '음악',
+    'Entertainment': '엔터테인먼트',
+    'Education': '교육',
+    'Technology': '기술',
+    'Sports': '스포츠',
+    'Comedy': '코미디',
+    'Gaming': '게임',
+    'Film': '영화',
+    'Television': 'TV'
+}
+
+# 업로드 요일 이름 (datetime.weekday() 인덱스, 로케일 비의존)
+_WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+def _normalize_keyword_text(text: str) -> str:
+    """전각 문자/인용부호/대시 변형을 통일하고 소문자로 변환합니다."""
+    if not text.isascii():
+        text = unicodedata.normalize('NFKC', text).translate(_KEYWORD_PUNCT_TABLE)
+    return text.lower()
+
+def _extract_keywords(text: str) -> List[str]:
+    """텍스트에서 키워드를 추출합니다 (최대 5개)."""
+    if not text:
+        return []
+    
+    # 간단한 키워드 추출 로직 (실제로는 더 정교한 NLP 사용 가능)
+    keywords = []
+    
+    for word in _normalize_keyword_text(text).split():
+        # 특수문자 제거
+        clean_word = _KEYWORD_CLEAN_RE.sub('', word)
+        # 길이 체크 및 일반적인 단어 제외
+        if len(clean_word) >= 2 and clean_word not in _COMMON_WORDS:
+            keywords.append(clean_word)
+            if len(keywords) == 5:
+                break
+    
+    return keywords
+
+@lru_cache(maxsize=1024)
+def _keyword_set(text: str) -> frozenset:
+    """키워드 집합 (같은 채널 텍스트는 캐시된 결과 재사용)"""
+    return frozenset(_extract_keywords(text))
+
+class _ChannelStats(NamedTuple):
+    """채널 통계 (반복 비교 계산용 경량 구조)"""
+    subscriber_count: int
+    view_count: int
+    video_count: int
+    
+    @classmethod
+    def from_channel(cls, channel_data: Dict[str, Any]) -> '_ChannelStats':
+        statistics = channel_data['statistics']
+        return cls(statistics['subscriber_count'], statistics['view_count'], statistics['video_count'])
+
+class _ChannelProfile(NamedTuple):
+    """유사도/성과 비교에 쓰는 채널 사전 계산 값 (채널당 한 번만 생성)"""
+    topics: frozenset
+    keywords: frozenset
+    stats: _ChannelStats
+    
+    @classmethod
+    def from_channel(cls, channel_data: Dict[str, Any]) -> '_ChannelProfile':
+        return cls(
+            topics=frozenset(channel_data.get('topic_details', {}).get('topic_categories', ())),
+            keywords=_keyword_set(f"{channel_data.get('title', '')} {channel_data.get('description', '')}"),
+            stats=_ChannelStats.from_channel(channel_data)
+        )
+
 class CompetitorAnalyzer:
     """경쟁사 분석 서비스 클래스"""
     
     def __init__(self):
-        self.youtube_service = YouTubeDataAPIService()
+        self.youtube_service = YouTubeDataAPIService(max_concurrent_requests=MAX_CONCURRENT_API_CALLS)
+        # (조회 키) -> (저장 시각, 성공 응답)
+        self._channel_info_cache: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+        # 진행 중인 조회 (같은 채널에 대한 동시 요청이 API를 중복 호출하지 않도록 공유)
+        self._channel_info_pending: Dict[Tuple, asyncio.Future] = {}
+        # Redis 사용 재개 시각 (연결 실패 시 일정 시간 API로 바로 조회)
+        self._persistent_cache_retry_at = 0.0
+    
+    async def _get_channel_info_cached(self, **lookup: str) -> Dict[str, Any]:
+        """채널 정보를 TTL 캐시를 거쳐 조회합니다 (channel_id 또는 url 키)."""
+        key = tuple(sorted(lookup.items()))
+        
+        cached = self._channel_info_cache.get(key)
+        if cached and time.monotonic() - cached[0] < CHANNEL_INFO_CACHE_TTL:
+            return cached[1]
+        
+        pending = self._channel_info_pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_channel_info(lookup))
+            self._channel_info_pending[key] = pending
+            pending.add_done_callback(lambda _: self._channel_info_pending.pop(key, None))
+        
+        result = await asyncio.shield(pending)
+        
+        # 성공한 응답만 캐시
+        if result.get('success'):
+            self._store_channel_info(key, result)
+        
+        return result
+    
+    async def _fetch_channel_info(self, lookup: Dict[str, str]) -> Dict[str, Any]:
+        """Redis 영구 캐시를 먼저 확인한 뒤 YouTube API로 채널 정보를 조회합니다."""
+        channel_id = lookup.get('channel_id')
+        if channel_id:
+            persisted = await self._load_persisted_channels([channel_id])
+            if channel_id in persisted:
+                return self._channel_info_result(persisted[channel_id])
+        
+        result = await self.youtube_service.get_channel_info(**lookup)
+        
+        if result.get('success') and result.get('data'):
+            await self._persist_channels([result['data']])
+        
+        return result
+    
+    def _channel_info_result(self, channel: Dict[str, Any]) -> Dict[str, Any]:
+        """채널 데이터를 get_channel_info 응답 형식으로 감쌉니다."""
+        return {
+            'success': True,
+            'message': 'Channel information retrieved successfully',
+            'data': channel
+        }
+    
+    def _persistent_channel_key(self, channel_id: str) -> str:
+        """(채널 ID, UTC 날짜) 기준 Redis 키를 생성합니다."""
+        return f"channel_info:{channel_id}:{time.strftime('%Y-%m-%d', time.gmtime())}"
+    
+    def _persistent_cache_available(self) -> bool:
+        """Redis 영구 캐시 사용 가능 여부를 반환합니다."""
+        return time.monotonic() >= self._persistent_cache_retry_at
+    
+    def _disable_persistent_cache(self, error: Exception) -> None:
+        """Redis 오류 시 일정 시간 동안 영구 캐시를 건너뜁니다."""
+        logger.warning(f"Redis channel cache unavailable, falling back to API: {str(error)}")
+        self._persistent_cache_retry_at = time.monotonic() + PERSISTENT_CACHE_RETRY_DELAY
+    
+    async def _load_persisted_channels(self, channel_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Redis에서 채널 정보를 일괄 조회합니다 (channel_id -> 채널 데이터)."""
+        if not channel_ids or not self._persistent_cache_available():
+            return {}
+        
+        try:
+            values = await redis_client.get_client().mget(
+                [self._persistent_channel_key(channel_id) for channel_id in channel_ids]
+            )
+        except Exception as e:
+            self._disable_persistent_cache(e)
+            return {}
+        
+        return {
+            channel_id: json.loads(value)
+            for channel_id, value in zip(channel_ids, values)
+            if value
+        }
+    
+    async def _persist_channels(self, channels: List[Dict[str, Any]]) -> None:
+        """채널 정보를 Redis에 TTL과 함께 저장합니다."""
+        if not channels or not self._persistent_cache_available():
+            return
+        
+        try:
+            async with redis_client.get_client().pipeline(transaction=False) as pipe:
+                for channel in channels:
+                    pipe.setex(
+                        self._persistent_channel_key(channel['channel_id']),
+                        PERSISTENT_CACHE_TTL,
+                        json.dumps(channel, ensure_ascii=False)
+                    )
+                await pipe.execute()
+        except Exception as e:
+            self._disable_persistent_cache(e)
+    
+    def _store_channel_info(self, key: Tuple, result: Dict[str, Any]) -> None:
+        """성공한 채널 조회 결과를 캐시에 저장합니다 (가장 오래된 항목부터 제거)."""
+        self._channel_info_cache.pop(key, None)
+        if len(self._channel_info_cache) >= CHANNEL_INFO_CACHE_SIZE:
+            self._channel_info_cache.pop(next(iter(self._channel_info_cache)))
+        self._channel_info_cache[key] = (time.monotonic(), result)
+    
+    async def _get_channels_info_batched(self, channel_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 채널 ID를 캐시 확인 후 channels.list 일괄 호출로 조회합니다 (channel_id -> 채널 데이터)."""
+        found = {}
+        missing = []
+        now = time.monotonic()
+        
+        for channel_id in dict.fromkeys(channel_ids):
+            cached = self._channel_info_cache.get((('channel_id', channel_id),))
+            if cached and now - cached[0] < CHANNEL_INFO_CACHE_TTL:
+                found[channel_id] = cached[1]['data']
+            else:
+                missing.append(channel_id)
+        
+        # 메모리 캐시에 없는 채널은 Redis 영구 캐시 확인
+        persisted = await self._load_persisted_channels(missing)
+        for channel_id, channel in persisted.items():
+            found[channel_id] = channel
+            self._store_channel_info((('channel_id', channel_id),), self._channel_info_result(channel))
+        missing = [channel_id for channel_id in missing if channel_id not in persisted]
+        
+        if missing:
+            batch_result = await self.youtube_service.get_channels_info(missing)
+            if batch_result.get('success'):
+                for channel in batch_result['data']['channels']:
+                    channel_id = channel['channel_id']
+                    found[channel_id] = channel
+                    self._store_channel_info((('channel_id', channel_id),), self._channel_info_result(channel))
+                await self._persist_channels(batch_result['data']['channels'])
+            else:
+                logger.warning(f"Batch channel lookup failed: {batch_result.get('message')}")
+        
+        return found
     
     async def analyze_competitors(self, 
                                 target_channel_id: str,
@@ -30,7 +277,7 @@ class CompetitorAnalyzer:
             logger.info(f"Starting competitor analysis for channel: {target_channel_id}")
             
             # 1단계: 대상 채널 정보 조회
-            target_channel_info = await self.youtube_service.get_channel_info(channel_id=target_channel_id)
+            target_channel_info = await self._get_channel_info_cached(channel_id=target_channel_id)
             
             if not target_channel_info.get('success'):
                 return {
@@ -44,27 +291,38 @@ class CompetitorAnalyzer:
             # 2단계: 경쟁사 URL에서 채널 정보 수집
             competitors = await self._get_competitors_from_urls(competitor_urls)
             
-            # 4단계: 각 경쟁사의 상세 분석
+            # 3단계: 모든 경쟁사의 최근 비디오를 한 번의 파이프라인으로 조회
+            videos_by_channel = await self._get_recent_videos_by_channel(competitors)
+            
+            # 4단계: 각 경쟁사의 상세 분석 (API 호출 없이 동기 처리)
             competitor_analyses = []
+            competitor_stats = self._empty_competitor_stats()
+            # 대상 채널의 주제/키워드/통계는 경쟁사마다 다시 계산하지 않도록 한 번만 준비
+            target_profile = _ChannelProfile.from_channel(target_data)
+            
             for competitor in competitors:
-                analysis = await self._analyze_single_competitor(
-                    target_data=target_data,
+                analysis = self._analyze_single_competitor(
+                    target_profile=target_profile,
                     competitor_data=competitor,
+                    recent_videos=videos_by_channel.get(competitor['channel_id']),
                     analysis_period=analysis_period
                 )
                 if analysis:
                     competitor_analyses.append(analysis)
+                    self._accumulate_competitor_stats(competitor_stats, analysis)
             
             # 5단계: 전략적 제안 생성
             strategic_recommendations = self._generate_strategic_recommendations(
                 target_data=target_data,
-                competitor_analyses=competitor_analyses
+                competitor_analyses=competitor_analyses,
+                competitor_stats=competitor_stats
             )
             
             # 6단계: 종합 인사이트 생성
             market_insights = self._generate_market_insights(
                 target_data=target_data,
-                competitor_analyses=competitor_analyses
+                competitor_analyses=competitor_analyses,
+                competitor_stats=competitor_stats
             )
             
             logger.info(f"Competitor analysis completed for {target_channel_id}. Found {len(competitor_analyses)} competitors")
@@ -86,7 +344,7 @@ class CompetitorAnalyzer:
                     'market_insights': market_insights,
                     'analysis_metadata': {
                         'analysis_period': analysis_period,
-                        'analyzed_at': datetime.now().isoformat(),
+                        'analyzed_at': now_isoformat(),
                         'total_competitors_found': len(competitor_analyses)
                     }
                 }
@@ -100,76 +358,100 @@ class CompetitorAnalyzer:
                 'data': None
             }
     
+    async def _get_recent_videos_by_channel(self, competitors: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """경쟁사들의 최근 비디오를 일괄 조회합니다 (channel_id -> 비디오 목록)."""
+        if not competitors:
+            return {}
+        
+        recent_videos = await self.youtube_service.get_recent_videos_for_channels(
+            [competitor['channel_id'] for competitor in competitors],
+            per_channel=20
+        )
+        
+        if not recent_videos.get('success'):
+            logger.warning(f"Failed to get recent videos for competitors: {recent_videos.get('message')}")
+            return {}
+        
+        return recent_videos['data']['videos_by_channel']
+    
     async def _get_competitors_from_urls(self, competitor_urls: List[str]) -> List[Dict[str, Any]]:
         """경쟁사 URL 목록에서 채널 정보를 가져옵니다."""
         competitors = []
         
+        # 채널 ID가 드러나는 URL은 channels.list 한 번으로 일괄 조회
+        url_channel_ids = {}
         for url in competitor_urls:
-            try:
-                # URL에서 채널 정보 추출
-                channel_info = await self.youtube_service.get_channel_info(url=url)
-                
-                if channel_info.get('success') and channel_info.get('data'):
-                    competitors.append(channel_info['data'])
+            extracted = self.youtube_service._extract_channel_info_from_url(url)
+            if extracted.get('channel_id'):
+                url_channel_ids[url] = extracted['channel_id']
+        
+        batched = {}
+        if url_channel_ids:
+            batched = await self._get_channels_info_batched(list(url_channel_ids.values()))
+        
+        # 핸들/사용자명 URL은 개별 조회를 동시에 요청
+        lookup_urls = [url for url in competitor_urls if url not in url_channel_ids]
+        results = await asyncio.gather(
+            *(self._get_channel_info_cached(url=url) for url in lookup_urls),
+            return_exceptions=True
+        )
+        url_results = dict(zip(lookup_urls, results))
+        
+        for url in competitor_urls:
+            if url in url_channel_ids:
+                channel_data = batched.get(url_channel_ids[url])
+                if channel_data:
+                    competitors.append(channel_data)
                 else:
                     logger.warning(f"Failed to get channel info for URL: {url}")
-                    
-            except Exception as e:
-                logger.error(f"Error processing competitor URL {url}: {str(e)}")
                 continue
+            
+            channel_info = url_results[url]
+            if isinstance(channel_info, Exception):
+                logger.error(f"Error processing competitor URL {url}: {str(channel_info)}")
+                continue
+            
+            if channel_info.get('success') and channel_info.get('data'):
+                competitors.append(channel_info['data'])
+            else:
+                logger.warning(f"Failed to get channel info for URL: {url}")
         
         return competitors
     
     async def _extract_topic_keywords(self, channel_data: Dict[str, Any]) -> List[str]:
         """채널 데이터에서 주제 키워드를 추출합니다."""
-        keywords = []
-        
         # 채널 제목에서 키워드 추출
         title = channel_data.get('title', '')
         title_keywords = self._extract_keywords_from_text(title)
-        keywords.extend(title_keywords)
         
         # 채널 설명에서 키워드 추출
         description = channel_data.get('description', '')
-        desc_keywords = self._extract_keywords_from_text(description)
-        keywords.extend(desc_keywords[:5])  # 상위 5개만
+        desc_keywords = self._extract_keywords_from_text(description)[:5]  # 상위 5개만
         
         # 브랜딩 키워드 추출
         branding_keywords = channel_data.get('branding', {}).get('keywords', '')
-        if branding_keywords:
-            brand_keywords = [kw.strip() for kw in branding_keywords.split(',')]
-            keywords.extend(brand_keywords[:3])  # 상위 3개만
+        brand_keywords = [kw.strip() for kw in branding_keywords.split(',')][:3] if branding_keywords else []  # 상위 3개만
         
-        # topicCategories에서 키워드 추출
+        # topicCategories에서 키워드 추출 (필요할 때만 변환)
         topic_categories = channel_data.get('topic_details', {}).get('topic_categories', [])
-        for topic_url in topic_categories:
-            topic_keyword = self._extract_keyword_from_wikipedia_url(topic_url)
-            if topic_keyword:
-                keywords.append(topic_keyword)
+        topic_keywords = map(self._extract_keyword_from_wikipedia_url, topic_categories)
+        
+        # 순서 유지하며 중복 제거, 최대 8개에서 중단
+        seen = set()
+        unique_keywords = []
+        for keyword in chain(title_keywords, desc_keywords, brand_keywords, topic_keywords):
+            if not keyword or keyword in seen:
+                continue
+            seen.add(keyword)
+            unique_keywords.append(keyword)
+            if len(unique_keywords) == 8:
+                break
         
-        # 중복 제거 및 상위 키워드만 반환
-        unique_keywords = list(dict.fromkeys(keywords))  # 순서 유지하며 중복 제거
-        return unique_keywords[:8]  # 최대 8개 키워드
+        return unique_keywords
     
     def _extract_keywords_from_text(self, text: str) -> List[str]:
         """텍스트에서 키워드를 추출합니다."""
-        if not text:
-            return []
-        
-        # 간단한 키워드 추출 로직 (실제로는 더 정교한 NLP 사용 가능)
-        common_words = {'채널', '구독', '좋아요', '댓글', '영상', '비디오', 'channel', 'subscribe', 'like', 'comment', 'video'}
-        
-        words = text.lower().split()
-        keywords = []
-        
-        for word in words:
-            # 특수문자 제거
-            clean_word = ''.join(c for c in word if c.isalnum() or c in '가-힣')
-            # 길이 체크 및 일반적인 단어 제외
-            if len(clean_word) >= 2 and clean_word not in common_words:
-                keywords.append(clean_word)
-        
-        return keywords[:5]  # 상위 5개만
+        return _extract_keywords(text)  # 상위 5개만
     
     def _extract_keyword_from_wikipedia_url(self, url: str) -> Optional[str]:
         """Wikipedia URL에서 키워드를 추출합니다."""
@@ -178,20 +460,7 @@ class CompetitorAnalyzer:
             keyword = url.split('/')[-1].replace('_', ' ')
             
             # 영어 키워드를 한국어로 변환 (간단한 매핑)
-            keyword_mapping = {
-                'Video game': '게임',
-                'Music': '음악',
-                'Entertainment': '엔터테인먼트',
-                'Education': '교육',
-                'Technology': '기술',
-                'Sports': '스포츠',
-                'Comedy': '코미디',
-                'Gaming': '게임',
-                'Film': '영화',
-                'Television': 'TV'
-            }
-            
-            return keyword_mapping.get(keyword, keyword.lower())
+            return _TOPIC_KEYWORD_MAP.get(keyword, keyword.lower())
         except:
             return None
     
@@ -218,11 +487,9 @@ class CompetitorAnalyzer:
             filtered_channels = [ch for ch in channels if ch['channel_id'] != target_channel_id]
             
             # 각 채널의 상세 정보 조회
-            detailed_channels = []
-            for channel in filtered_channels[:max_results]:
-                channel_info = await self.youtube_service.get_channel_info(channel_id=channel['channel_id'])
-                if channel_info.get('success'):
-                    detailed_channels.append(channel_info['data'])
+            candidate_ids = [ch['channel_id'] for ch in filtered_channels[:max_results]]
+            channels_by_id = await self._get_channels_info_batched(candidate_ids)
+            detailed_channels = [channels_by_id[cid] for cid in candidate_ids if cid in channels_by_id]
             
             return detailed_channels
             
@@ -230,28 +497,27 @@ class CompetitorAnalyzer:
             logger.error(f"Error finding similar channels: {str(e)}")
             return []
     
-    async def _analyze_single_competitor(self, 
-                                       target_data: Dict[str, Any],
-                                       competitor_data: Dict[str, Any],
-                                       analysis_period: str) -> Optional[Dict[str, Any]]:
+    def _analyze_single_competitor(self, 
+                                 target_profile: _ChannelProfile,
+                                 competitor_data: Dict[str, Any],
+                                 recent_videos: Optional[List[Dict[str, Any]]],
+                                 analysis_period: str) -> Optional[Dict[str, Any]]:
         """단일 경쟁사를 분석합니다."""
         try:
+            # 주제/키워드/통계는 한 번만 추출해 재사용
+            competitor_profile = _ChannelProfile.from_channel(competitor_data)
+            competitor_stats = competitor_profile.stats
+            
             # 기본 성과 비교
-            performance_comparison = self._calculate_performance_comparison(target_data, competitor_data)
+            performance_comparison = self._calculate_performance_comparison(target_profile.stats, competitor_stats)
             
             # 채널 유사도 계산
-            similarity_score = self._calculate_channel_similarity(target_data, competitor_data)
-            
-            # 경쟁사의 최근 비디오 분석
-            recent_videos = await self.youtube_service.get_channel_videos(
-                channel_id=competitor_data['channel_id'],
-                max_results=20,
-                order='date'
-            )
+            similarity_score = self._calculate_channel_similarity(target_profile, competitor_profile)
             
+            # 경쟁사의 최근 비디오 분석 (일괄 조회된 결과 사용)
             content_insights = {}
-            if recent_videos.get('success'):
-                content_insights = self._analyze_content_strategy(recent_videos['data']['videos'])
+            if recent_videos:
+                content_insights = self._analyze_content_strategy(recent_videos)
             
             return {
                 'channel_id': competitor_data['channel_id'],
@@ -259,68 +525,54 @@ class CompetitorAnalyzer:
                 'similarity_score': similarity_score,
                 'performance_comparison': performance_comparison,
                 'content_insights': content_insights,
-                'channel_stats': {
-                    'subscriber_count': competitor_data['statistics']['subscriber_count'],
-                    'view_count': competitor_data['statistics']['view_count'],
-                    'video_count': competitor_data['statistics']['video_count']
-                }
+                'channel_stats': competitor_stats._asdict()
             }
             
         except Exception as e:
             logger.error(f"Error analyzing competitor {competitor_data.get('channel_id', 'unknown')}: {str(e)}")
             return None
     
-    def _calculate_performance_comparison(self, target_data: Dict[str, Any], competitor_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculate_performance_comparison(self, target_stats: _ChannelStats, competitor_stats: _ChannelStats) -> Dict[str, Any]:
         """성과 비교를 계산합니다."""
-        target_stats = target_data['statistics']
-        competitor_stats = competitor_data['statistics']
-        
         # 안전한 나눗셈을 위한 함수
         def safe_ratio(a, b):
             return a / b if b > 0 else 0
         
         return {
-            'subscriber_ratio': safe_ratio(competitor_stats['subscriber_count'], target_stats['subscriber_count']),
-            'view_ratio': safe_ratio(competitor_stats['view_count'], target_stats['view_count']),
-            'video_ratio': safe_ratio(competitor_stats['video_count'], target_stats['video_count']),
+            'subscriber_ratio': safe_ratio(competitor_stats.subscriber_count, target_stats.subscriber_count),
+            'view_ratio': safe_ratio(competitor_stats.view_count, target_stats.view_count),
+            'video_ratio': safe_ratio(competitor_stats.video_count, target_stats.video_count),
             'avg_views_per_video_ratio': safe_ratio(
-                safe_ratio(competitor_stats['view_count'], competitor_stats['video_count']),
-                safe_ratio(target_stats['view_count'], target_stats['video_count'])
+                safe_ratio(competitor_stats.view_count, competitor_stats.video_count),
+                safe_ratio(target_stats.view_count, target_stats.video_count)
             )
         }
     
-    def _calculate_channel_similarity(self, target_data: Dict[str, Any], competitor_data: Dict[str, Any]) -> float:
-        """채널 유사도를 계산합니다."""
+    def _calculate_channel_similarity(self, target_profile: _ChannelProfile, competitor_profile: _ChannelProfile) -> float:
+        """채널 유사도를 계산합니다 (사전 계산된 채널 프로필 사용)."""
         similarity_score = 0.0
         
-        # 주제 카테고리 유사도 (50% 가중치)
-        target_topics = set(target_data.get('topic_details', {}).get('topic_categories', []))
-        competitor_topics = set(competitor_data.get('topic_details', {}).get('topic_categories', []))
+        target_topics = target_profile.topics
+        competitor_topics = competitor_profile.topics
+        target_subs = target_profile.stats.subscriber_count
+        competitor_subs = competitor_profile.stats.subscriber_count
         
+        # 주제 카테고리 유사도 (50% 가중치)
         if target_topics and competitor_topics:
-            topic_overlap = len(target_topics.intersection(competitor_topics))
-            topic_union = len(target_topics.union(competitor_topics))
-            topic_similarity = topic_overlap / topic_union if topic_union > 0 else 0
-            similarity_score += topic_similarity * 0.5
+            topic_overlap = len(target_topics & competitor_topics)
+            topic_union = len(target_topics) + len(competitor_topics) - topic_overlap
+            similarity_score += topic_overlap / topic_union * 0.5
         
         # 키워드 유사도 (30% 가중치)
-        target_keywords = set(self._extract_keywords_from_text(
-            f"{target_data.get('title', '')} {target_data.get('description', '')}"
-        ))
-        competitor_keywords = set(self._extract_keywords_from_text(
-            f"{competitor_data.get('title', '')} {competitor_data.get('description', '')}"
-        ))
+        target_keywords = target_profile.keywords
+        competitor_keywords = competitor_profile.keywords
         
         if target_keywords and competitor_keywords:
-            keyword_overlap = len(target_keywords.intersection(competitor_keywords))
-            keyword_union = len(target_keywords.union(competitor_keywords))
-            keyword_similarity = keyword_overlap / keyword_union if keyword_union > 0 else 0
-            similarity_score += keyword_similarity * 0.3
+            keyword_overlap = len(target_keywords & competitor_keywords)
+            keyword_union = len(target_keywords) + len(competitor_keywords) - keyword_overlap
+            similarity_score += keyword_overlap / keyword_union * 0.3
         
         # 규모 유사도 (20% 가중치)
-        target_subs = target_data['statistics']['subscriber_count']
-        competitor_subs = competitor_data['statistics']['subscriber_count']
-        
         if target_subs > 0 and competitor_subs > 0:
             size_ratio = min(target_subs, competitor_subs) / max(target_subs, competitor_subs)
             similarity_score += size_ratio * 0.2
@@ -328,75 +580,96 @@ class CompetitorAnalyzer:
         return min(similarity_score, 1.0)  # 최대 1.0으로 제한
     
     def _analyze_content_strategy(self, videos: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """콘텐츠 전략을 분석합니다."""
+        """콘텐츠 전략을 분석합니다 (제목 패턴과 업로드 패턴을 한 번의 순회로 집계)."""
         if not videos:
             return {}
         
-        # 제목 패턴 분석
-        title_patterns = []
+        title_patterns = set()
         total_length = 0
+        upload_days = []
+        upload_hours = []
         
         for video in videos:
+            # 제목 패턴 분석
             title = video.get('title', '')
             total_length += len(title)
             
-            # 특수문자 사용 패턴
-            if any(char in title for char in ['✨', '🔥', '❤️', '💎', '⭐']):
-                title_patterns.append('이모지 사용')
-            if '!' in title or '?' in title:
-                title_patterns.append('감정 표현')
-            if any(word in title.upper() for word in ['NEW', '신작', '최신', '업데이트']):
-                title_patterns.append('신규성 강조')
-        
-        avg_title_length = total_length / len(videos) if videos else 0
-        
-        # 업로드 패턴 분석
-        upload_pattern = self._analyze_upload_pattern(videos)
-        
-        return {
-            'avg_title_length': round(avg_title_length, 1),
-            'common_title_patterns': list(set(title_patterns)),
-            'upload_pattern': upload_pattern,
-            'recent_video_count': len(videos)
-        }
-    
-    def _analyze_upload_pattern(self, videos: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """업로드 패턴을 분석합니다."""
-        if not videos:
-            return {}
-        
-        upload_days = []
-        upload_hours = []
-        
-        for video in videos:
+            # 특수문자 사용 패턴 (문자 집합 교집합으로 한 번에 검사)
+            chars = set(title)
+            if not chars.isdisjoint(_TITLE_EMOJIS):
+                title_patterns.add('이모지 사용')
+            if not chars.isdisjoint(_TITLE_PUNCTUATION):
+                title_patterns.add('감정 표현')
+            title_upper = title.upper()
+            if any(word in title_upper for word in _NOVELTY_WORDS):
+                title_patterns.add('신규성 강조')
+            
+            # 업로드 시각 수집
             published_at = video.get('published_at')
             if published_at:
                 try:
                     dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                    upload_days.append(dt.strftime('%A'))
+                    upload_days.append(_WEEKDAY_NAMES[dt.weekday()])
                     upload_hours.append(dt.hour)
                 except:
                     continue
         
+        avg_title_length = total_length / len(videos)
+        
+        return {
+            'avg_title_length': round(avg_title_length, 1),
+            'common_title_patterns': list(title_patterns),
+            'upload_pattern': self._summarize_upload_pattern(upload_days, upload_hours, len(videos)),
+            'recent_video_count': len(videos)
+        }
+    
+    def _summarize_upload_pattern(self, upload_days: List[str], upload_hours: List[int], video_count: int) -> Dict[str, Any]:
+        """수집된 업로드 요일/시간으로 업로드 패턴을 요약합니다."""
         # 가장 빈번한 업로드 요일과 시간
-        most_common_day = max(set(upload_days), key=upload_days.count) if upload_days else None
+        most_common_day = Counter(upload_days).most_common(1)[0][0] if upload_days else None
         avg_hour = sum(upload_hours) / len(upload_hours) if upload_hours else None
         
         return {
             'most_common_upload_day': most_common_day,
             'avg_upload_hour': round(avg_hour, 1) if avg_hour else None,
-            'upload_frequency': f"최근 {len(videos)}개 영상"
+            'upload_frequency': f"최근 {video_count}개 영상"
+        }
+    
+    def _empty_competitor_stats(self) -> Dict[str, List[float]]:
+        """컬럼별 경쟁사 통계(구독자 수, 동영상 수, 영상당 평균 조회수)의 빈 누적 구조를 만듭니다."""
+        return {
+            'subscribers': [],
+            'video_counts': [],
+            'avg_views': []
         }
     
+    def _accumulate_competitor_stats(self, competitor_stats: Dict[str, List[float]], analysis: Dict[str, Any]) -> None:
+        """경쟁사 분석 결과 하나의 통계를 컬럼별 리스트에 누적합니다."""
+        comp_stats = analysis['channel_stats']
+        competitor_stats['subscribers'].append(comp_stats['subscriber_count'])
+        competitor_stats['video_counts'].append(comp_stats['video_count'])
+        competitor_stats['avg_views'].append(comp_stats['view_count'] / max(comp_stats['video_count'], 1))
+    
+    def _collect_competitor_stats(self, competitor_analyses: List[Dict[str, Any]]) -> Dict[str, List[float]]:
+        """경쟁사 통계를 컬럼별 리스트로 한 번에 추출합니다."""
+        competitor_stats = self._empty_competitor_stats()
+        for comp in competitor_analyses:
+            self._accumulate_competitor_stats(competitor_stats, comp)
+        return competitor_stats
+    
     def _generate_strategic_recommendations(self, 
                                           target_data: Dict[str, Any],
-                                          competitor_analyses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                                          competitor_analyses: List[Dict[str, Any]],
+                                          competitor_stats: Optional[Dict[str, List[float]]] = None) -> List[Dict[str, Any]]:
         """전략적 제안을 생성합니다."""
         recommendations = []
         
         if not competitor_analyses:
             return recommendations
         
+        if competitor_stats is None:
+            competitor_stats = self._collect_competitor_stats(competitor_analyses)
+        
         # 성과 분석을 위한 데이터 수집
         better_performers = [comp for comp in competitor_analyses 
                            if comp['performance_comparison']['subscriber_ratio'] > 1.2]
@@ -410,7 +683,7 @@ class CompetitorAnalyzer:
                 common_patterns.extend(patterns)
             
             if common_patterns:
-                most_common = max(set(common_patterns), key=common_patterns.count)
+                most_common = Counter(common_patterns).most_common(1)[0][0]
                 recommendations.append({
                     'priority': 'high',
                     'type': 'content_strategy',
@@ -420,8 +693,8 @@ class CompetitorAnalyzer:
         
         # 업로드 빈도 분석
         target_video_count = target_data['statistics']['video_count']
-        avg_competitor_videos = sum(comp['channel_stats']['video_count'] 
-                                  for comp in competitor_analyses) / len(competitor_analyses)
+        video_counts = competitor_stats['video_counts']
+        avg_competitor_videos = sum(video_counts) / len(video_counts)
         
         if avg_competitor_videos > target_video_count * 1.5:
             recommendations.append({
@@ -448,7 +721,8 @@ class CompetitorAnalyzer:
     
     def _generate_market_insights(self, 
                                 target_data: Dict[str, Any],
-                                competitor_analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
+                                competitor_analyses: List[Dict[str, Any]],
+                                competitor_stats: Optional[Dict[str, List[float]]] = None) -> Dict[str, Any]:
         """시장 인사이트를 생성합니다."""
         if not competitor_analyses:
             return {
@@ -459,9 +733,12 @@ class CompetitorAnalyzer:
                 'competitive_advantage': '분석 대상 경쟁사 없음'
             }
         
+        if competitor_stats is None:
+            competitor_stats = self._collect_competitor_stats(competitor_analyses)
+        
         # 시장 위치 분석
         target_subs = target_data['statistics']['subscriber_count']
-        competitor_subs = [comp['channel_stats']['subscriber_count'] for comp in competitor_analyses]
+        competitor_subs = competitor_stats['subscribers']
         
         market_position = 'top'
         better_count = sum(1 for subs in competitor_subs if subs > target_subs)
@@ -476,12 +753,7 @@ class CompetitorAnalyzer:
         
         # 평균 조회수 분석
         target_avg_views = target_data['statistics']['view_count'] / max(target_data['statistics']['video_count'], 1)
-        competitor_avg_views = []
-        
-        for comp in competitor_analyses:
-            comp_stats = comp['channel_stats']
-            comp_avg = comp_stats['view_count'] / max(comp_stats['video_count'], 1)
-            competitor_avg_views.append(comp_avg)
+        competitor_avg_views = competitor_stats['avg_views']
         
         if competitor_avg_views:
             market_avg_views = sum(competitor_avg_views) / len(competitor_avg_views)
@@ -1,15 +1,23 @@
 """YouTube OAuth 2.0 인증 서비스"""
 
 import os
-import secrets
-import json
+import asyncio
+import base64
+import hashlib
+import random
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from urllib.parse import urlencode
 
 import httpx
+import httplib2
+import orjson
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import Flow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -20,6 +28,223 @@ from ..models.auth_models import (
 )
 from ..core.config import settings
 
+# 모든 OAuth 호출이 공유하는 HTTP 클라이언트 (googleapis.com 연결 재사용)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """keep-alive 연결 풀을 가진 공유 httpx.AsyncClient 반환 (지연 생성)"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=300)
+        )
+    return _http_client
+
+
+# Google API 동시 요청 상한 (자격 증명당 동시 연결 제한 대응)
+_API_SEMAPHORE = asyncio.Semaphore(settings.GOOGLE_MAX_CONCURRENCY)
+
+# googleapiclient 동기 호출 전용 스레드 풀 (기본 executor와 분리, 크기는 동시 요청 상한과 동일)
+_GOOGLE_API_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.GOOGLE_MAX_CONCURRENCY,
+    thread_name_prefix='google-api'
+)
+
+
+async def _run_google_api(func, *args) -> Any:
+    """블로킹 googleapiclient 호출을 전용 스레드 풀에서 실행 (이벤트 루프 차단 방지)"""
+    async with _API_SEMAPHORE:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_GOOGLE_API_EXECUTOR, func, *args)
+
+# 일시적 오류(429/5xx) 재시도 설정
+MAX_RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0  # 초
+RETRY_MAX_DELAY = 16.0  # 초
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def _retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """재시도 가능한 오류면 대기 시간(지수 백오프 + 지터, Retry-After 우선), 아니면 None"""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        retry_after = error.response.headers.get('Retry-After')
+    elif isinstance(error, HttpError):
+        status = error.resp.status
+        retry_after = error.resp.get('retry-after')
+    elif isinstance(error, httpx.TransportError):
+        status, retry_after = None, None  # 연결 오류는 항상 재시도
+    else:
+        return None
+    
+    if status is not None and status not in _RETRYABLE_STATUS:
+        return None
+    
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1)) + random.uniform(0, RETRY_BASE_DELAY)
+    try:
+        delay = max(delay, float(retry_after))
+    except (TypeError, ValueError):
+        pass  # 헤더가 없거나 HTTP 날짜 형식이면 백오프 값 사용
+    return delay
+
+
+async def _send_with_retry(send, *args, **kwargs) -> httpx.Response:
+    """httpx 요청을 보내고 429/5xx/연결 오류면 백오프 후 재시도"""
+    for attempt in range(1, MAX_RETRY_ATTEMPTS + 1):
+        try:
+            # 백오프 대기 중에는 슬롯을 점유하지 않도록 요청 단위로 획득
+            async with _API_SEMAPHORE:
+                response = await send(*args, **kwargs)
+            response.raise_for_status()
+            return response
+        except (httpx.HTTPStatusError, httpx.TransportError) as e:
+            delay = _retry_delay(e, attempt)
+            if delay is None or attempt == MAX_RETRY_ATTEMPTS:
+                raise
+            await asyncio.sleep(delay)
+
+
+# googleapiclient용 httplib2 연결 (httplib2.Http는 스레드 안전하지 않아 작업 스레드별로 공유)
+GOOGLE_API_HTTP_TIMEOUT = 30  # 초
+_thread_local = threading.local()
+
+
+def _shared_http() -> httplib2.Http:
+    """현재 스레드의 httplib2.Http 반환 (토큰이 달라도 같은 TCP/TLS 연결 재사용)"""
+    http = getattr(_thread_local, 'http', None)
+    if http is None:
+        http = _thread_local.http = httplib2.Http(timeout=GOOGLE_API_HTTP_TIMEOUT)
+    return http
+
+
+def _authorized_http(credentials: Credentials) -> AuthorizedHttp:
+    """자격 증명을 현재 스레드의 공유 연결에 연결"""
+    return AuthorizedHttp(credentials, http=_shared_http())
+
+
+def _execute_request(request) -> Dict[str, Any]:
+    """googleapiclient 요청 실행 (Resource는 여러 스레드에서 재사용되므로 실행하는 스레드의 연결로 요청)"""
+    return request.execute(http=_authorized_http(request.http.credentials))
+
+
+async def _run_google_api_with_retry(func, *args) -> Any:
+    """_run_google_api 실행이 429/5xx HttpError로 실패하면 백오프 후 재시도
+    
+    대기는 이벤트 루프에서 하므로 백오프 중에는 동시 요청 슬롯과 작업 스레드를 점유하지 않습니다.
+    """
+    for attempt in range(1, MAX_RETRY_ATTEMPTS + 1):
+        try:
+            return await _run_google_api(func, *args)
+        except HttpError as e:
+            delay = _retry_delay(e, attempt)
+            if delay is None or attempt == MAX_RETRY_ATTEMPTS:
+                raise
+            await asyncio.sleep(delay)
+
+
+# OAuth state용 난수 풀 (os.urandom 시스템 호출 한 번을 여러 state 생성에 나눠 사용)
+STATE_BYTES = 32
+STATE_POOL_REFILL_BYTES = 4096
+_state_pool = bytearray()
+_state_pool_lock = threading.Lock()
+
+
+def _generate_state() -> str:
+    """CSRF 방지용 state 생성 (secrets.token_urlsafe(32)와 같은 형식)"""
+    with _state_pool_lock:
+        if len(_state_pool) < STATE_BYTES:
+            _state_pool.extend(os.urandom(STATE_POOL_REFILL_BYTES))
+        raw = bytes(_state_pool[:STATE_BYTES])
+        del _state_pool[:STATE_BYTES]
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode('ascii')
+
+
+def _token_key(access_token: str) -> str:
+    """액세스 토큰 원문 대신 캐시 키로 쓰는 해시"""
+    return hashlib.blake2b(access_token.encode(), digest_size=16).hexdigest()
+
+
+# 발급/갱신된 액세스 토큰의 만료 시각 (토큰 해시 -> 만료 시각)
+TOKEN_EXPIRY_MARGIN = timedelta(seconds=30)
+_token_expiry: Dict[str, datetime] = {}
+
+
+def _remember_token_expiry(access_token: str, expires_at: datetime) -> None:
+    """토큰 만료 시각 기록 (만료된 항목은 함께 정리)"""
+    now = datetime.utcnow()
+    for key in [key for key, expiry in _token_expiry.items() if expiry <= now]:
+        del _token_expiry[key]
+    _token_expiry[_token_key(access_token)] = expires_at
+
+
+# 액세스 토큰별 YouTube API Resource 캐시 (토큰 해시 -> (생성 시각, Resource))
+YOUTUBE_SERVICE_CACHE_TTL = 3300  # 초 (액세스 토큰 만료 1시간 직전까지)
+YOUTUBE_SERVICE_CACHE_SIZE = 256
+_youtube_services: Dict[str, Tuple[float, Any]] = {}
+_youtube_services_lock = threading.Lock()  # 작업 스레드들이 동시에 조회/갱신하므로 보호
+
+
+def _get_youtube_service(credentials: Credentials) -> Any:
+    """같은 액세스 토큰이면 이미 생성된 YouTube API Resource 재사용"""
+    token_hash = _token_key(credentials.token)
+    now = time.monotonic()
+    
+    with _youtube_services_lock:
+        cached = _youtube_services.get(token_hash)
+    if cached and now - cached[0] < YOUTUBE_SERVICE_CACHE_TTL:
+        return cached[1]
+    
+    # 라이브러리에 포함된 discovery 문서 사용 (파일 캐시 비활성화), 연결은 스레드별 공유 연결 사용
+    # (생성은 잠금 밖에서 수행해 다른 스레드의 캐시 조회를 막지 않음)
+    youtube = build('youtube', 'v3', http=_authorized_http(credentials), cache_discovery=False)
+    
+    with _youtube_services_lock:
+        _youtube_services.pop(token_hash, None)
+        if len(_youtube_services) >= YOUTUBE_SERVICE_CACHE_SIZE:
+            _youtube_services.pop(next(iter(_youtube_services)))
+        _youtube_services[token_hash] = (now, youtube)
+    
+    return youtube
+
+
+# 액세스 토큰별 채널 목록 캐시 (토큰 해시 -> (조회 시각, 채널 목록))
+USER_CHANNELS_CACHE_TTL = 300  # 초
+USER_CHANNELS_CACHE_SIZE = 256
+_user_channels: Dict[str, Tuple[float, List[UserChannel]]] = {}
+
+
+def _get_cached_user_channels(access_token: str) -> Optional[List[UserChannel]]:
+    """TTL 이내에 조회한 채널 목록 반환 (없으면 None)"""
+    cached = _user_channels.get(_token_key(access_token))
+    if cached and time.monotonic() - cached[0] < USER_CHANNELS_CACHE_TTL:
+        return cached[1]
+    return None
+
+
+def _store_user_channels(access_token: str, channels: List[UserChannel]) -> None:
+    """채널 목록 캐시 저장 (가장 오래된 항목부터 제거)"""
+    token_hash = _token_key(access_token)
+    _user_channels.pop(token_hash, None)
+    if len(_user_channels) >= USER_CHANNELS_CACHE_SIZE:
+        _user_channels.pop(next(iter(_user_channels)))
+    _user_channels[token_hash] = (time.monotonic(), channels)
+
+
+# 리프레시 토큰별 진행 중인 갱신 (리프레시 토큰 해시 -> 갱신 태스크)
+# 같은 사용자의 동시 요청은 진행 중인 갱신 하나를 함께 기다리고, 완료되면 바로 제거해
+# 이후 요청(예: 401 이후 재갱신)은 항상 새로 갱신
+_refresh_tasks: Dict[str, asyncio.Task] = {}
+
+
+async def close_http_client() -> None:
+    """공유 HTTP 클라이언트 종료 (앱 종료 시 호출)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class YouTubeOAuthService:
     """YouTube OAuth 2.0 인증 서비스"""
@@ -52,7 +277,7 @@ class YouTubeOAuthService:
         """OAuth 인증 URL 생성"""
         try:
             # CSRF 방지를 위한 state 생성
-            state = secrets.token_urlsafe(32)
+            state = _generate_state()
             
             flow = Flow.from_client_config(
                 self.client_config,
@@ -101,27 +326,39 @@ class YouTubeOAuthService:
     async def get_user_info(self, access_token: str) -> UserInfo:
         """액세스 토큰으로 사용자 정보 조회"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://www.googleapis.com/oauth2/v2/userinfo",
-                    headers={"Authorization": f"Bearer {access_token}"}
-                )
-                response.raise_for_status()
-                
-                user_data = response.json()
-                
-                return UserInfo(
-                    google_id=user_data["id"],
-                    email=user_data["email"],
-                    name=user_data["name"],
-                    picture=user_data.get("picture")
-                )
-                
+            client = get_http_client()
+            response = await _send_with_retry(
+                client.get,
+                "https://www.googleapis.com/oauth2/v2/userinfo",
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+            
+            user_data = orjson.loads(response.content)
+            
+            return UserInfo(
+                google_id=user_data["id"],
+                email=user_data["email"],
+                name=user_data["name"],
+                picture=user_data.get("picture")
+            )
+            
         except Exception as e:
             raise Exception(f"사용자 정보 조회 실패: {str(e)}")
 
     async def get_user_channels(self, access_token: str, refresh_token: str = None) -> List[UserChannel]:
-        """사용자의 YouTube 채널 목록 조회"""
+        """사용자의 YouTube 채널 목록 조회 (블로킹 API 호출은 스레드에서 실행)"""
+        try:
+            channels = await _run_google_api_with_retry(self._sync_get_user_channels, access_token, refresh_token)
+        except HttpError as e:
+            if e.resp.status == 401:
+                raise Exception(f"인증이 필요합니다. 다시 로그인해주세요.")
+            raise Exception(f"채널 목록 조회 실패: {str(e)}")
+        
+        _store_user_channels(access_token, channels)
+        return channels
+
+    def _sync_get_user_channels(self, access_token: str, refresh_token: str = None) -> List[UserChannel]:
+        """사용자의 YouTube 채널 목록 조회 (googleapiclient 동기 호출)"""
         try:
             # 토큰 갱신 정보를 포함한 Credentials 객체 생성
             credentials = Credentials(
@@ -136,14 +373,14 @@ class YouTubeOAuthService:
             if refresh_token:
                 credentials.refresh(Request())
             
-            youtube = build('youtube', 'v3', credentials=credentials)
+            youtube = _get_youtube_service(credentials)
             
             # 사용자의 채널 목록 조회
             request = youtube.channels().list(
                 part='snippet,statistics,contentDetails',
                 mine=True
             )
-            response = request.execute()
+            response = _execute_request(request)
             
             channels = []
             for item in response.get('items', []):
@@ -163,47 +400,72 @@ class YouTubeOAuthService:
             
             return channels
             
-        except HttpError as e:
-            if e.resp.status == 401:
-                raise Exception(f"인증이 필요합니다. 다시 로그인해주세요.")
-            raise Exception(f"채널 목록 조회 실패: {str(e)}")
+        except HttpError:
+            raise  # 재시도와 오류 메시지 변환은 get_user_channels에서 처리
         except Exception as e:
             raise Exception(f"채널 목록 조회 중 오류: {str(e)}")
 
     async def refresh_access_token(self, refresh_token: str) -> TokenResponse:
-        """리프레시 토큰으로 액세스 토큰 갱신"""
+        """리프레시 토큰으로 액세스 토큰 갱신 (동시 갱신 요청은 하나로 합침)"""
+        refresh_key = _token_key(refresh_token)
+        
+        task = _refresh_tasks.get(refresh_key)
+        if task is None:
+            task = asyncio.ensure_future(self._request_token_refresh(refresh_token))
+            _refresh_tasks[refresh_key] = task
+            
+            def _evict(done_task: asyncio.Task) -> None:
+                if _refresh_tasks.get(refresh_key) is done_task:
+                    del _refresh_tasks[refresh_key]
+            
+            task.add_done_callback(_evict)
+        
+        # 한 요청이 취소되어도 함께 기다리는 다른 요청의 갱신은 계속되도록 shield
+        return await asyncio.shield(task)
+
+    async def _request_token_refresh(self, refresh_token: str) -> TokenResponse:
+        """토큰 엔드포인트에 갱신 요청"""
         try:
-            async with httpx.AsyncClient() as client:
-                data = {
-                    'client_id': self.client_id,
-                    'client_secret': self.client_secret,
-                    'refresh_token': refresh_token,
-                    'grant_type': 'refresh_token'
-                }
-                
-                response = await client.post(
-                    "https://oauth2.googleapis.com/token",
-                    data=data
-                )
-                response.raise_for_status()
-                
-                token_data = response.json()
-                
-                return TokenResponse(
-                    access_token=token_data['access_token'],
-                    refresh_token=refresh_token,  # 리프레시 토큰은 보통 변경되지 않음
-                    expires_in=token_data['expires_in'],
-                    token_type=token_data['token_type'],
-                    scope=token_data.get('scope', '')
-                )
-                
+            client = get_http_client()
+            data = {
+                'client_id': self.client_id,
+                'client_secret': self.client_secret,
+                'refresh_token': refresh_token,
+                'grant_type': 'refresh_token'
+            }
+            
+            response = await _send_with_retry(
+                client.post,
+                "https://oauth2.googleapis.com/token",
+                data=data
+            )
+            
+            token_data = orjson.loads(response.content)
+            
+            _remember_token_expiry(
+                token_data['access_token'],
+                datetime.utcnow() + timedelta(seconds=token_data['expires_in'])
+            )
+            
+            return TokenResponse(
+                access_token=token_data['access_token'],
+                refresh_token=refresh_token,  # 리프레시 토큰은 보통 변경되지 않음
+                expires_in=token_data['expires_in'],
+                token_type=token_data['token_type'],
+                scope=token_data.get('scope', '')
+            )
+            
         except Exception as e:
             raise Exception(f"토큰 갱신 실패: {str(e)}")
 
     async def verify_channel_access(self, access_token: str, channel_id: str) -> ChannelAccessResponse:
         """사용자가 특정 채널에 접근 권한이 있는지 확인"""
         try:
-            user_channels = await self.get_user_channels(access_token)
+            # 인증 직후나 반복 확인 시에는 최근 조회한 채널 목록 재사용
+            # (channels.list는 mine과 id 필터를 함께 쓸 수 없어 단일 채널 조회로 대체 불가)
+            user_channels = _get_cached_user_channels(access_token)
+            if user_channels is None:
+                user_channels = await self.get_user_channels(access_token)
             
             for channel in user_channels:
                 if channel.channel_id == channel_id:
@@ -232,14 +494,15 @@ class YouTubeOAuthService:
             # 1. 코드로 토큰 교환
             token_response = await self.exchange_code_for_tokens(code, state)
             
-            # 2. 사용자 정보 조회
-            user_info = await self.get_user_info(token_response.access_token)
-            
-            # 3. 사용자 채널 목록 조회
-            channels = await self.get_user_channels(token_response.access_token, token_response.refresh_token)
+            # 2~3. 사용자 정보와 채널 목록은 서로 독립적이므로 동시에 조회
+            user_info, channels = await asyncio.gather(
+                self.get_user_info(token_response.access_token),
+                self.get_user_channels(token_response.access_token, token_response.refresh_token)
+            )
             
             # 4. 만료 시간 계산
             expires_at = datetime.utcnow() + timedelta(seconds=token_response.expires_in)
+            _remember_token_expiry(token_response.access_token, expires_at)
             
             return AuthenticatedUser(
                 user_info=user_info,
@@ -252,15 +515,24 @@ class YouTubeOAuthService:
         except Exception as e:
             raise Exception(f"사용자 인증 실패: {str(e)}")
 
-    def validate_token(self, access_token: str) -> bool:
+    async def validate_token(self, access_token: str) -> bool:
         """액세스 토큰 유효성 검증"""
+        # 이 서버에서 발급/갱신한 토큰은 기록된 만료 시각으로 API 호출 없이 판단
+        expires_at = _token_expiry.get(_token_key(access_token))
+        if expires_at is not None:
+            return expires_at > datetime.utcnow() + TOKEN_EXPIRY_MARGIN
+        
+        return await _run_google_api(self._sync_validate_token, access_token)
+
+    def _sync_validate_token(self, access_token: str) -> bool:
+        """만료 시각을 모르는 토큰을 API 호출로 검증 (googleapiclient 동기 호출)"""
         try:
             credentials = Credentials(token=access_token)
-            youtube = build('youtube', 'v3', credentials=credentials)
+            youtube = _get_youtube_service(credentials)
             
-            # 간단한 API 호출로 토큰 유효성 검증
+            # 만료 시각을 모르는 토큰만 간단한 API 호출로 검증
             request = youtube.channels().list(part='id', mine=True)
-            request.execute()
+            request.execute(http=_authorized_http(credentials))
             
             return True
             
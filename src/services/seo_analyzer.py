@@ -1,10 +1,18 @@
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Optional, Tuple, NamedTuple
 import re
 import statistics
+import copy
+import hashlib
 from collections import Counter
 from datetime import datetime, timedelta
 import logging
 import math
+import heapq
+from operator import itemgetter
+from itertools import chain
+import time
+from bisect import bisect_left, bisect_right
+from functools import lru_cache, partial
 
 from src.models.seo_config_models import (
     SEOAnalysisConfig, 
@@ -15,11 +23,357 @@ from src.models.seo_config_models import (
 
 logger = logging.getLogger(__name__)
 
+# Python 3.11+의 fromisoformat은 'Z' 접미사를 직접 처리 (문자열 치환 불필요)
+try:
+    datetime.fromisoformat('2000-01-01T00:00:00Z')
+    _ISOFORMAT_ACCEPTS_Z = True
+except ValueError:
+    _ISOFORMAT_ACCEPTS_Z = False
+
+def _parse_published_at(published_at: str) -> datetime:
+    """YouTube publishedAt (YYYY-MM-DDTHH:MM:SSZ) 문자열을 UTC datetime으로 변환"""
+    if _ISOFORMAT_ACCEPTS_Z:
+        return datetime.fromisoformat(published_at)
+    return datetime.fromisoformat(published_at.replace('Z', '+00:00'))
+
+def _bucket_counts(values: List[float], bounds: List[float]) -> List[int]:
+    """정렬된 경계값 기준 구간별 개수를 한 번의 순회로 계산 (구간 i: bounds[i-1] <= v < bounds[i])"""
+    counts = [0] * (len(bounds) + 1)
+    for value in values:
+        counts[bisect_right(bounds, value)] += 1
+    return counts
+
+def _sorted_bucket_counts(sorted_values: List[float], bounds: List[float]) -> List[int]:
+    """정렬된 값 목록의 구간별 개수 (경계값마다 이진 탐색 한 번, 구간 정의는 _bucket_counts와 동일)"""
+    positions = [bisect_left(sorted_values, bound) for bound in bounds]
+    return [end - start for start, end in zip([0] + positions, positions + [len(sorted_values)])]
+
+def _trie_pattern(node: Dict[str, Any]) -> str:
+    """접두사 트리를 정규식으로 변환 (공통 접두사를 한 번만 비교, 같은 위치에서는 가장 긴 키워드 매칭)"""
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+    
+    pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:  # 여기서 끝나는 키워드가 있으면 나머지는 선택적
+        pattern = '(?:' + pattern + ')?'
+    return pattern
+
+def _compile_keyword_union(keywords: Iterable[str]) -> 're.Pattern':
+    """키워드들을 접두사 트리 형태의 정규식 하나로 합쳐 한 번의 스캔으로 포함 여부를 확인"""
+    unique_keywords = set(keywords)
+    if not unique_keywords:
+        return re.compile(r'(?!)')  # 빈 목록은 아무것도 매칭하지 않음
+    
+    trie: Dict[str, Any] = {}
+    for keyword in unique_keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}  # 키워드 끝 표시
+    return re.compile(_trie_pattern(trie))
+
+# 설명 콘텐츠 패턴 (설명마다 재컴파일/캐시 조회하지 않도록 미리 컴파일)
+_HASHTAG_RE = re.compile(r'#\w+')
+_URL_RE = re.compile(r'https?://\S+')
+
+# 가독성 판단용 특수문자 삭제 테이블 (str.translate 한 번으로 개수 계산)
+_SPECIAL_CHAR_DELETE_TABLE = str.maketrans('', '', '!@#$%^&*()_+-=[]{};\':"\\|,.<>?')
+
+def _count_matches(pattern: 're.Pattern', text: str, marker: str) -> int:
+    """매치 개수 계산 (marker: 모든 매치에 들어 있는 리터럴, 없으면 정규식 스캔 생략)"""
+    if marker not in text:
+        return 0
+    # 매치가 적어 C에서 만드는 findall 리스트가 finditer 제너레이터 순회보다 빠름
+    return len(pattern.findall(text))
+
+# 호기심 갭 지표
+_CURIOSITY_RE = _compile_keyword_union([
+    # 한국어
+    '비밀', '진실', '이유', '방법', '놀라운', '충격', '실제로', '정말', '사실',
+    '몰랐던', '숨겨진', '미공개', '최초', '독점', '내부', '뒤에서',
+    # 영어  
+    'secret', 'truth', 'reason', 'hidden', 'revealed', 'shocking', 
+    'surprising', 'unknown', 'behind', 'real', 'actual'
+])
+
+# 파워 워드
+_POWER_WORDS_RE = _compile_keyword_union([
+    # 한국어 (2024 트렌드 반영)
+    '완벽', '최고', '최상', '프리미엄', '고급', '전문', '마스터', '프로',
+    '보장', '확실', '검증', '인증', '공식', '정식', '정품', '신뢰',
+    '혁신', '혁명', '획기적', '새로운', '최신', '업데이트', '개선',
+    '꿀템', '신박', '갓생', '핫플', '존맛', '킹받', '띵작', '실화',
+    # 영어 (2024 트렌드 반영)
+    'ultimate', 'best', 'premium', 'professional', 'master', 'expert',
+    'guaranteed', 'proven', 'certified', 'official', 'authentic',
+    'revolutionary', 'innovative', 'breakthrough', 'advanced',
+    'viral', 'trending', 'game-changer', 'mind-blowing', 'epic'
+])
+
+# 구체적 혜택/결과 지표 (시간, 수치, 개수 패턴을 하나의 정규식으로 통합)
+_BENEFIT_RE = re.compile(r'\d+(?:분|시간|일|주|개월|%|배|원|만원|가지|개|번)')
+_DIGIT_RE = re.compile(r'\d')
+
+# 제목 패턴 지표
+_HOW_TO_RE = _compile_keyword_union(['how to', '어떻게', '방법'])
+_LIST_FORMAT_RE = re.compile(r'\d+.*가지|\d+.*things|\d+.*ways')
+_QUESTION_WORD_RE = _compile_keyword_union(['왜', '무엇', '언제'])
+_YEAR_RE = re.compile(r'20\d{2}')
+
+# ISO 8601 영상 길이 (PT1H2M30S)
+_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+
+@lru_cache(maxsize=4096)
+def _parse_iso_duration(duration_str: str) -> int:
+    """ISO 8601 duration을 초로 변환 (영상당 여러 번, 같은 길이도 자주 나오므로 캐시)"""
+    match = _DURATION_RE.match(duration_str)
+    if not match:
+        return 0
+    
+    hours = int(match.group(1) or 0)
+    minutes = int(match.group(2) or 0)
+    seconds = int(match.group(3) or 0)
+    return hours * 3600 + minutes * 60 + seconds
+
+def _duration_seconds(duration_str: str) -> int:
+    """비디오 duration 값을 초로 변환 (없거나 형식이 잘못되면 0)"""
+    if not duration_str:
+        return 0
+    
+    try:
+        # PT1H2M30S 형태 파싱
+        return _parse_iso_duration(duration_str)
+    except:
+        pass
+    
+    return 0
+
+# 과도한 클릭베이트 지표
+_CLICKBAIT_INDICATORS = (
+    '!!!', '???', '대박!!!', '충격!!!', '실화???',
+    '클릭', '누르면', '보면', '절대', '무조건'
+)
+
+class _TitleFeatures(NamedTuple):
+    """제목 한 번의 처리로 얻는 특징 (점수 계산과 제목 분석에서 공유)"""
+    length: int
+    word_count: int
+    video_type: str
+    clickbait: bool
+    front_loaded: bool
+    emotional: bool
+    curiosity: bool
+    benefits: bool
+    power: bool
+    numbers: bool
+    readable: bool
+
+class _DescriptionFeatures(NamedTuple):
+    """설명 한 번 순회로 얻는 특징 (점수 계산과 설명 분석에서 공유)"""
+    length: int
+    line_count: int
+    strong_opening: bool
+    call_to_action: bool
+    well_structured: bool
+    video_summary: bool
+    hashtag_count: int
+    url_count: int
+    keyword_density: float
+
+# 참여도 점수 구간표 (값 >= 경계값이면 다음 구간 점수, bisect_right로 조회)
+_LIKE_RATIO_BOUNDS = (0.5, 1.0, 2.0)           # 좋아요 비율 (%)
+_LIKE_RATIO_POINTS = (5, 15, 25, 30)
+_COMMENT_RATIO_BOUNDS = (0.1, 0.2, 0.5)        # 댓글 비율 (%)
+_COMMENT_RATIO_POINTS = (3, 12, 20, 25)
+_TOTAL_ENGAGEMENT_BOUNDS = (1.0, 2.0, 3.0)     # 좋아요 + 댓글 비율 (%)
+_TOTAL_ENGAGEMENT_POINTS = (5, 15, 20, 25)
+_ENGAGEMENT_PER_MINUTE_BOUNDS = (0.5, 1.0)     # 분당 참여율
+_ENGAGEMENT_PER_MINUTE_POINTS = (8, 15, 20)
+
+class _VideoStats(NamedTuple):
+    """비디오 통계 (분석 시작 시 비디오당 한 번만 추출해 점수 계산/집계에서 공유)"""
+    view_count: int
+    like_count: int
+    comment_count: int
+    duration: int            # 초
+    like_ratio: float        # 조회수 대비 % (조회수 0이면 0)
+    comment_ratio: float
+    total_engagement: float
+    
+    @classmethod
+    def from_video(cls, video: Dict[str, Any]) -> '_VideoStats':
+        stats = video.get('statistics', {})
+        view_count = stats.get('view_count', 0)
+        like_count = stats.get('like_count', 0)
+        comment_count = stats.get('comment_count', 0)
+        
+        like_ratio = comment_ratio = total_engagement = 0.0
+        if view_count > 0:
+            like_ratio = (like_count / view_count) * 100
+            comment_ratio = (comment_count / view_count) * 100
+            total_engagement = ((like_count + comment_count) / view_count) * 100
+        
+        return cls(
+            view_count,
+            like_count,
+            comment_count,
+            _duration_seconds(video.get('duration', '')),
+            like_ratio,
+            comment_ratio,
+            total_engagement
+        )
+
+# 키워드 밀도 계산용 주요 키워드
+_DENSITY_KEYWORDS = frozenset(['유튜브', 'youtube', '영상', 'video', '채널', 'channel'])
+
+def _keyword_density(words: List[str]) -> float:
+    """소문자 단어 목록의 키워드 밀도 (10단어 미만이면 0)"""
+    if len(words) < 10:
+        return 0
+    
+    # 주요 키워드들의 출현 빈도 계산 (실제로는 더 정교한 키워드 분석 필요)
+    keyword_count = sum(1 for word in words if word in _DENSITY_KEYWORDS)
+    
+    return (keyword_count / len(words)) * 100
+
+# 비디오 타입 추정 지표
+_SHORTS_INDICATOR_RE = _compile_keyword_union(['shorts', 'short', '짧은', '1분', '30초', '#shorts'])
+_LIVE_INDICATOR_RE = _compile_keyword_union(['live', '라이브', '생방송', 'stream'])
+
+# 설명 첫 줄 훅 요소
+_HOOK_ELEMENT_RE = _compile_keyword_union([
+    '궁금', '놀라운', '충격', '비밀', '진실', '실제', '정말',
+    'amazing', 'shocking', 'incredible', 'secret', 'truth'
+])
+
+# 행동 유도 문구
+_CTA_RE = _compile_keyword_union([
+    '구독', '좋아요', '댓글', '공유', '알림', '클릭', '시청',
+    'subscribe', 'like', 'comment', 'share', 'bell', 'click', 'watch'
+])
+
+# 영상 요약 지표
+_SUMMARY_RE = _compile_keyword_union([
+    '요약', '정리', '핵심', '포인트', '내용', '개요',
+    'summary', 'overview', 'key points', 'highlights'
+])
+
+def _is_excessive_clickbait(title: str) -> bool:
+    """과도한 클릭베이트인지 확인 (지표 2개를 찾으면 나머지 검사 생략)"""
+    # '클릭', '보면' 같은 단어 지표도 있어 '!!!'/'???' 유무만으로는 미리 거를 수 없음
+    if len(title) < 4:  # 가장 짧은 지표(2자) 두 개가 들어갈 수 없음
+        return False
+    
+    excessive_count = 0
+    for indicator in _CLICKBAIT_INDICATORS:
+        if indicator in title:
+            excessive_count += 1
+            if excessive_count >= 2:
+                return True
+    return False
+
+def _is_readable_title(title: str) -> bool:
+    """제목의 가독성 확인"""
+    # 너무 길거나 짧지 않고, 적절한 구두점 사용
+    if len(title) < 10 or len(title) > 100:
+        return False
+    
+    # 과도한 특수문자 사용 확인
+    special_char_count = len(title) - len(title.translate(_SPECIAL_CHAR_DELETE_TABLE))
+    special_char_ratio = special_char_count / len(title)
+    if special_char_ratio > 0.3:
+        return False
+    
+    return True
+
+def _guess_video_type(title_lower: str) -> str:
+    """제목으로부터 비디오 타입 추정 (소문자로 변환된 제목을 받음)"""
+    if _SHORTS_INDICATOR_RE.search(title_lower):
+        return 'shorts'
+    elif _LIVE_INDICATOR_RE.search(title_lower):
+        return 'live'
+    else:
+        return 'regular'
+
+# 제목/설명 특징 캐시 (분석 호출 간 공유, 템플릿 제목이나 반복되는 설명 문구가 많음)
+FEATURE_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=FEATURE_CACHE_SIZE)
+def _extract_title_features(front_loaded_re: 're.Pattern', emotional_re: 're.Pattern',
+                            title: str) -> _TitleFeatures:
+    """제목 특징을 한 번에 계산 (설정 의존 키워드 정규식도 캐시 키에 포함)"""
+    title_lower = title.lower()
+    words = title_lower.split()
+    return _TitleFeatures(
+        length=len(title),
+        word_count=len(words),
+        video_type=_guess_video_type(title_lower),
+        clickbait=_is_excessive_clickbait(title),
+        front_loaded=len(words) >= 3 and front_loaded_re.search(' '.join(words[:3])) is not None,
+        emotional=emotional_re.search(title_lower) is not None,
+        curiosity=_CURIOSITY_RE.search(title_lower) is not None,
+        benefits=_BENEFIT_RE.search(title) is not None,
+        power=_POWER_WORDS_RE.search(title_lower) is not None,
+        numbers=_DIGIT_RE.search(title) is not None,
+        readable=_is_readable_title(title)
+    )
+
+@lru_cache(maxsize=FEATURE_CACHE_SIZE)
+def _extract_description_features(description: str) -> _DescriptionFeatures:
+    """설명 특징을 한 번에 계산 (줄 분리와 소문자 변환은 각각 한 번만 수행)"""
+    lines = description.split('\n')
+    line_count = len(lines)
+    description_lower = description.lower()
+    first_line = lines[0]
+    return _DescriptionFeatures(
+        length=len(description),
+        line_count=line_count,
+        strong_opening=(
+            20 <= len(first_line) <= 150 and
+            _HOOK_ELEMENT_RE.search(description_lower.partition('\n')[0]) is not None
+        ),
+        call_to_action=_CTA_RE.search(description_lower) is not None,
+        # 5줄 이상이고 빈 줄이 하나 이상 있으면 구조화된 설명 (_is_well_structured와 동일)
+        well_structured=line_count >= 5 and any(not line.strip() for line in lines),
+        video_summary=_SUMMARY_RE.search(description_lower) is not None,
+        hashtag_count=_count_matches(_HASHTAG_RE, description, '#'),
+        url_count=_count_matches(_URL_RE, description, 'http'),
+        keyword_density=_keyword_density(description_lower.split())
+    )
+
+# SEO 분석 결과 캐시 (분석기는 요청마다 생성되므로 모듈 레벨에서 공유)
+SEO_RESULT_CACHE_TTL = 3600  # 초 (채널의 비디오 목록은 자주 바뀌지 않음)
+SEO_RESULT_CACHE_SIZE = 1024
+_seo_result_cache: Dict[Tuple[str, Optional[ChannelType]], Tuple[float, Dict[str, Any]]] = {}
+
+def _video_set_fingerprint(videos: List[Dict[str, Any]], video_stats: List[_VideoStats]) -> str:
+    """비디오 목록의 지문 (분석에 쓰이는 비디오별 필드가 하나라도 바뀌면 달라짐)
+    
+    캐시 키가 제목/설명 원문을 붙잡고 있지 않도록 필드들의 해시만 반환합니다.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for video, stats in zip(videos, video_stats):
+        digest.update(repr((
+            video.get('video_id') or video.get('id'),
+            video.get('title'),
+            video.get('description'),
+            video.get('duration'),
+            video.get('published_at'),
+            tuple(video.get('tags') or ()),
+            stats.view_count,
+            stats.like_count,
+            stats.comment_count
+        )).encode())
+    return digest.hexdigest()
+
 class SEOAnalyzer:
     """Backlinko 가이드 기반 YouTube SEO 분석기"""
     
     def __init__(self, config: Optional[SEOAnalysisConfig] = None):
         self.config = config or get_default_seo_config()
+        # 결과 캐시는 기본 설정으로 분석할 때만 사용 (설정이 다르면 결과도 다름)
+        self._use_result_cache = config is None
         
         # Backlinko 기반 SEO 요소 가중치 (2024 업데이트)
         self.seo_factors = {
@@ -84,6 +438,44 @@ class SEOAnalyzer:
             }
         }
         
+        # 비디오마다 쓰는 기준 구간을 미리 풀어 둠 (점수 계산 시 중첩 딕셔너리 조회/곱셈 생략)
+        self._title_length_bands = self.industry_benchmarks['optimal_title_length']
+        self._description_optimal_range = self.industry_benchmarks['description_length']['optimal']
+        self._description_minimum = self.industry_benchmarks['description_length']['minimum']
+        optimal_length = self.industry_benchmarks['average_video_length'].get('default', 600)
+        self._duration_bands = (  # (허용 하한, 최적 하한, 최적 상한, 허용 상한)
+            0.5 * optimal_length, 0.7 * optimal_length, 1.5 * optimal_length, 2.0 * optimal_length
+        )
+        
+        # 설정 키워드를 카테고리별 목록 대신 합쳐진 정규식으로 미리 컴파일
+        korean_keywords = self.config.keyword_patterns.korean
+        english_keywords = self.config.keyword_patterns.english
+        # 목록을 이어 붙이지 않고 chain으로 순회만 함
+        self._front_loaded_keyword_re = _compile_keyword_union(
+            keyword.lower()
+            for category in ('attention_grabbing', 'question_words', 'trending_words')
+            for keyword in chain(getattr(korean_keywords, category, []), getattr(english_keywords, category, []))
+        )
+        self._emotional_trigger_re = _compile_keyword_union(chain(
+            korean_keywords.emotional_words,
+            english_keywords.emotional_words,
+            korean_keywords.attention_grabbing,
+            english_keywords.attention_grabbing
+        ))
+        
+        # 채널 타입 감지용 (키워드, 채널 타입) 평탄화 목록
+        self._channel_type_keywords = [
+            (keyword, channel_type)
+            for channel_type, keywords in self.config.channel_detection_keywords.items()
+            for keyword in keywords
+        ]
+        
+        # 제목/설명 특징 조회 (모듈 레벨 캐시를 사용해 분석 호출 간에도 재사용)
+        self._title_features = partial(
+            _extract_title_features, self._front_loaded_keyword_re, self._emotional_trigger_re
+        )
+        self._description_features = _extract_description_features
+        
     def analyze_comprehensive_seo(self, videos: List[Dict[str, Any]], 
                                  force_channel_type: Optional[ChannelType] = None) -> Dict[str, Any]:
         """종합적인 SEO 분석 수행"""
@@ -102,14 +494,25 @@ class SEOAnalyzer:
                 'data': None
             }
         
+        # 통계 필드는 비디오당 한 번만 꺼내 이후 계산에서 재사용
+        video_stats = [_VideoStats.from_video(video) for video in videos]
+        
+        cache_key = None
+        if self._use_result_cache:
+            cache_key = (_video_set_fingerprint(videos, video_stats), force_channel_type)
+            cached = _seo_result_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < SEO_RESULT_CACHE_TTL:
+                logger.info(f"SEO analysis cache hit for {len(videos)} videos")
+                return copy.deepcopy(cached[1])  # 호출자가 결과를 수정해도 캐시가 오염되지 않도록 복사본 반환
+        
         try:
             # 채널 타입 감지
             channel_type = force_channel_type or self._detect_channel_type(videos)
             
             # 비디오별 SEO 점수 계산
             video_seo_scores = []
-            for video in videos:
-                seo_score = self._calculate_video_seo_score(video, channel_type)
+            for video, stats in zip(videos, video_stats):
+                seo_score = self._calculate_video_seo_score(video, channel_type, stats)
                 video_seo_scores.append({
                     'video_id': video.get('id', ''),
                     'title': video.get('title', ''),
@@ -117,20 +520,27 @@ class SEOAnalyzer:
                     'video_data': video
                 })
             
-            # 성과별 그룹 분리
-            sorted_videos = sorted(video_seo_scores, key=lambda x: x['seo_score'], reverse=True)
+            # 성과별 그룹 분리 (전체 정렬 없이 상위/하위 k개만 선택)
+            top_count = max(1, int(len(video_seo_scores) * self.config.thresholds.percentile_threshold))
+            bottom_count = max(1, int(len(video_seo_scores) * self.config.thresholds.percentile_threshold))
             
-            top_count = max(1, int(len(sorted_videos) * self.config.thresholds.percentile_threshold))
-            bottom_count = max(1, int(len(sorted_videos) * self.config.thresholds.percentile_threshold))
+            score_key = itemgetter('seo_score')  # 힙 선택 3회에서 쓰는 C 수준 키 함수
+            top_performers = heapq.nlargest(top_count, video_seo_scores, key=score_key)
+            # 내림차순 정렬의 마지막 k개와 같은 순서(동점은 입력 순서)가 되도록 역순 입력에서 고른 뒤 뒤집음
+            bottom_performers = heapq.nsmallest(bottom_count, reversed(video_seo_scores), key=score_key)
+            bottom_performers.reverse()
             
-            top_performers = sorted_videos[:top_count]
-            bottom_performers = sorted_videos[-bottom_count:]
-            
-            # 세부 분석
-            title_analysis = self._analyze_titles_advanced([v['video_data'] for v in sorted_videos], channel_type)
-            description_analysis = self._analyze_descriptions_advanced([v['video_data'] for v in sorted_videos])
-            engagement_analysis = self._analyze_engagement_advanced([v['video_data'] for v in sorted_videos])
-            metadata_analysis = self._analyze_metadata([v['video_data'] for v in sorted_videos])
+            # 세부 분석 (집계 지표라 순서와 무관하므로 입력 순서 그대로 사용)
+            title_analysis = self._analyze_titles_advanced(videos, channel_type)
+            # 키워드 밀도 샘플은 점수 상위 비디오 기준 유지
+            density_sample = heapq.nlargest(
+                10, (v for v in video_seo_scores if v['video_data'].get('description')), key=score_key
+            )
+            description_analysis = self._analyze_descriptions_advanced(
+                videos, [v['video_data'] for v in density_sample]
+            )
+            engagement_analysis = self._analyze_engagement_advanced(video_stats)
+            metadata_analysis = self._analyze_metadata(videos)
             
             # 개선 제안 생성
             recommendations = self._generate_backlinko_recommendations(
@@ -141,21 +551,21 @@ class SEOAnalyzer:
             # SEO 점수 분포 분석
             score_distribution = self._analyze_score_distribution(video_seo_scores)
             
-            return {
+            result = {
                 'success': True,
                 'message': f'{len(videos)}개 비디오의 고급 SEO 분석이 완료되었습니다.',
                 'data': {
                     'total_videos': len(videos),
                     'channel_type': channel_type.value if isinstance(channel_type, ChannelType) else channel_type,
-                    'overall_seo_score': statistics.mean([v['seo_score'] for v in video_seo_scores]),
+                    'overall_seo_score': score_distribution['avg_score'],  # 분포 분석에서 계산한 전체 평균 재사용
                     'top_performers': {
                         'count': len(top_performers),
-                        'avg_score': statistics.mean([v['seo_score'] for v in top_performers]),
+                        'avg_score': statistics.fmean(v['seo_score'] for v in top_performers),
                         'videos': top_performers[:5]  # 상위 5개만 반환
                     },
                     'bottom_performers': {
                         'count': len(bottom_performers),
-                        'avg_score': statistics.mean([v['seo_score'] for v in bottom_performers]),
+                        'avg_score': statistics.fmean(v['seo_score'] for v in bottom_performers),
                         'videos': bottom_performers[:5]  # 하위 5개만 반환
                     },
                     'analysis': {
@@ -172,6 +582,14 @@ class SEOAnalyzer:
                 }
             }
             
+            if cache_key is not None:
+                _seo_result_cache.pop(cache_key, None)
+                if len(_seo_result_cache) >= SEO_RESULT_CACHE_SIZE:
+                    _seo_result_cache.pop(next(iter(_seo_result_cache)))
+                _seo_result_cache[cache_key] = (time.monotonic(), copy.deepcopy(result))
+            
+            return result
+            
         except Exception as e:
             logger.error(f"Advanced SEO analysis failed: {str(e)}")
             return {
@@ -180,33 +598,24 @@ class SEOAnalyzer:
                 'data': None
             }
     
-    def _calculate_video_seo_score(self, video: Dict[str, Any], channel_type: ChannelType) -> float:
+    def _calculate_video_seo_score(self, video: Dict[str, Any], channel_type: ChannelType,
+                                   stats: _VideoStats) -> float:
         """Backlinko 기준 비디오 SEO 점수 계산"""
         
-        scores = {}
-        
-        # 1. 제목 최적화 점수
-        scores['title'] = self._score_title_optimization(video.get('title', ''), channel_type)
-        
-        # 2. 설명 품질 점수
-        scores['description'] = self._score_description_quality(video.get('description', ''))
-        
-        # 3. 참여도 신호 점수
-        scores['engagement'] = self._score_engagement_signals(video)
-        
-        # 4. 영상 품질 점수
-        scores['video_quality'] = self._score_video_quality(video)
+        # 요소별 점수를 중간 딕셔너리 없이 바로 가중합 (비디오마다 호출되는 경로)
+        factors = self.seo_factors
         
-        # 5. 메타데이터 최적화 점수
-        scores['metadata'] = self._score_metadata_optimization(video)
-        
-        # 가중평균으로 최종 점수 계산
         final_score = (
-            scores['title'] * self.seo_factors['title_optimization'] +
-            scores['description'] * self.seo_factors['description_quality'] +
-            scores['engagement'] * self.seo_factors['engagement_signals'] +
-            scores['video_quality'] * self.seo_factors['video_quality'] +
-            scores['metadata'] * self.seo_factors['metadata_optimization']
+            # 1. 제목 최적화 점수
+            self._score_title_optimization(video.get('title', ''), channel_type) * factors['title_optimization'] +
+            # 2. 설명 품질 점수
+            self._score_description_quality(video.get('description', '')) * factors['description_quality'] +
+            # 3. 참여도 신호 점수
+            self._score_engagement_signals(stats) * factors['engagement_signals'] +
+            # 4. 영상 품질 점수
+            self._score_video_quality(stats) * factors['video_quality'] +
+            # 5. 메타데이터 최적화 점수
+            self._score_metadata_optimization(video) * factors['metadata_optimization']
         )
         
         return min(100, max(0, final_score))
@@ -219,10 +628,11 @@ class SEOAnalyzer:
         score = 0
         max_score = 100
         
+        features = self._title_features(title)
+        
         # 1. 길이 최적화 (20점)
-        video_type = self._guess_video_type_from_title(title)
-        optimal_range = self.industry_benchmarks['optimal_title_length'][video_type]
-        title_length = len(title)
+        optimal_range = self._title_length_bands[features.video_type]
+        title_length = features.length
         
         if optimal_range[0] <= title_length <= optimal_range[1]:
             score += 20
@@ -232,35 +642,35 @@ class SEOAnalyzer:
             score += 5   # 너무 길음
         
         # 2. 키워드 앞쪽 배치 (15점)
-        if self._has_front_loaded_keywords(title, channel_type):
+        if features.front_loaded:
             score += 15
         
         # 3. 감정적 트리거 사용 (15점)
-        if self._has_emotional_triggers(title):
+        if features.emotional:
             score += 15
         
         # 4. 호기심 갭 생성 (15점)
-        if self._creates_curiosity_gap(title):
+        if features.curiosity:
             score += 15
         
         # 5. 구체적 혜택/결과 제시 (10점)
-        if self._shows_specific_benefits(title):
+        if features.benefits:
             score += 10
         
         # 6. 파워 워드 사용 (10점)
-        if self._contains_power_words(title):
+        if features.power:
             score += 10
         
         # 7. 숫자/통계 포함 (10점)
-        if self._contains_numbers_or_stats(title):
+        if features.numbers:
             score += 10
         
         # 8. 클릭베이트 방지 (-5점, 과도한 경우)
-        if self._is_excessive_clickbait(title):
+        if features.clickbait:
             score -= 5
         
         # 9. 가독성 (5점)
-        if self._is_readable_title(title):
+        if features.readable:
             score += 5
         
         return min(max_score, score)
@@ -275,125 +685,91 @@ class SEOAnalyzer:
         
         # 1. 길이 최적화 (25점)
         desc_length = len(description)
-        optimal_range = self.industry_benchmarks['description_length']['optimal']
+        optimal_range = self._description_optimal_range
         
         if optimal_range[0] <= desc_length <= optimal_range[1]:
             score += 25
-        elif desc_length >= self.industry_benchmarks['description_length']['minimum']:
+        elif desc_length >= self._description_minimum:
             score += 15
         else:
             score += 5
         
+        features = self._description_features(description)
+        
         # 2. 첫 줄 훅 (20점)
-        if self._has_strong_opening_line(description):
+        if features.strong_opening:
             score += 20
         
         # 3. 키워드 밀도 (15점)
-        keyword_density = self._calculate_keyword_density(description)
+        keyword_density = features.keyword_density
         if 1.0 <= keyword_density <= 3.0:
             score += 15
         elif keyword_density > 0:
             score += 8
         
         # 4. 행동 유도 문구 (15점)
-        if self._has_call_to_action(description):
+        if features.call_to_action:
             score += 15
         
         # 5. 구조화된 내용 (10점)
-        if self._is_well_structured(description):
+        if features.well_structured:
             score += 10
         
         # 6. 해시태그 사용 (10점)
-        hashtag_count = len(re.findall(r'#\w+', description))
+        hashtag_count = features.hashtag_count
         if 1 <= hashtag_count <= 3:
             score += 10
         elif hashtag_count > 0:
             score += 5
         
         # 7. 영상 요약 포함 (5점)
-        if self._contains_video_summary(description):
+        if features.video_summary:
             score += 5
         
         return min(max_score, score)
     
-    def _score_engagement_signals(self, video: Dict[str, Any]) -> float:
+    def _score_engagement_signals(self, stats: _VideoStats) -> float:
         """참여도 신호 점수 계산"""
-        stats = video.get('statistics', {})
-        view_count = stats.get('view_count', 0)
-        
-        if view_count == 0:
+        if stats.view_count == 0:
             return 0
         
         score = 0
         max_score = 100
         
         # 1. 좋아요 비율 (30점)
-        like_count = stats.get('like_count', 0)
-        like_ratio = (like_count / view_count) * 100
-        
-        if like_ratio >= 2.0:      # 2% 이상 매우 좋음
-            score += 30
-        elif like_ratio >= 1.0:    # 1% 이상 좋음
-            score += 25
-        elif like_ratio >= 0.5:    # 0.5% 이상 보통
-            score += 15
-        else:
-            score += 5
+        score += _LIKE_RATIO_POINTS[bisect_right(_LIKE_RATIO_BOUNDS, stats.like_ratio)]
         
         # 2. 댓글 비율 (25점)
-        comment_count = stats.get('comment_count', 0)
-        comment_ratio = (comment_count / view_count) * 100
-        
-        if comment_ratio >= 0.5:   # 0.5% 이상 매우 좋음
-            score += 25
-        elif comment_ratio >= 0.2: # 0.2% 이상 좋음
-            score += 20
-        elif comment_ratio >= 0.1: # 0.1% 이상 보통
-            score += 12
-        else:
-            score += 3
+        score += _COMMENT_RATIO_POINTS[bisect_right(_COMMENT_RATIO_BOUNDS, stats.comment_ratio)]
         
-        # 3. 전체 참여율 (25점) - 좋아요 + 댓글
-        total_engagement = (like_count + comment_count) / view_count * 100
-        
-        if total_engagement >= 3.0:
-            score += 25
-        elif total_engagement >= 2.0:
-            score += 20
-        elif total_engagement >= 1.0:
-            score += 15
-        else:
-            score += 5
+        # 3. 전체 참여율 (25점) - 좋아요 + 댓글 (비율은 _VideoStats 생성 시 한 번만 계산)
+        total_engagement = stats.total_engagement
+        score += _TOTAL_ENGAGEMENT_POINTS[bisect_right(_TOTAL_ENGAGEMENT_BOUNDS, total_engagement)]
         
         # 4. 영상 길이 대비 참여도 (20점)
-        duration = self._parse_duration(video.get('duration', ''))
+        duration = stats.duration
         if duration > 0:
             engagement_per_minute = total_engagement / (duration / 60)
-            if engagement_per_minute >= 1.0:
-                score += 20
-            elif engagement_per_minute >= 0.5:
-                score += 15
-            else:
-                score += 8
+            score += _ENGAGEMENT_PER_MINUTE_POINTS[bisect_right(_ENGAGEMENT_PER_MINUTE_BOUNDS, engagement_per_minute)]
         else:
             score += 10  # 기본 점수
         
         return min(max_score, score)
     
-    def _score_video_quality(self, video: Dict[str, Any]) -> float:
+    def _score_video_quality(self, stats: _VideoStats) -> float:
         """영상 품질 점수 계산"""
         score = 0
         max_score = 100
         
         # 1. 영상 길이 최적화 (40점)
-        duration = self._parse_duration(video.get('duration', ''))
+        duration = stats.duration
         if duration > 0:
-            # 채널 타입별 최적 길이와 비교
-            optimal_length = self.industry_benchmarks['average_video_length'].get('default', 600)
+            # 채널 타입별 최적 길이와 비교 (구간은 __init__에서 미리 계산)
+            min_length, optimal_min, optimal_max, max_length = self._duration_bands
             
-            if 0.7 * optimal_length <= duration <= 1.5 * optimal_length:
+            if optimal_min <= duration <= optimal_max:
                 score += 40
-            elif 0.5 * optimal_length <= duration <= 2.0 * optimal_length:
+            elif min_length <= duration <= max_length:
                 score += 30
             else:
                 score += 15
@@ -406,9 +782,8 @@ class SEOAnalyzer:
         
         # 3. 썸네일 품질 추정 (30점)
         # 실제 썸네일 분석은 불가하므로 조회수와 참여도로 추정
-        stats = video.get('statistics', {})
-        view_count = stats.get('view_count', 0)
-        like_count = stats.get('like_count', 0)
+        view_count = stats.view_count
+        like_count = stats.like_count
         
         if view_count > 0 and like_count > 0:
             estimated_ctr = min((like_count / view_count) * 50, 30)  # 추정 CTR
@@ -450,89 +825,129 @@ class SEOAnalyzer:
         if not titles:
             return {}
         
-        # 기본 통계
-        title_lengths = [len(title) for title in titles]
-        word_counts = [len(title.split()) for title in titles]
+        # 제목당 한 번의 순회로 기본 통계와 최적화 지표를 함께 집계
+        title_lengths = []
+        total_words = 0
+        front_loading = emotional = curiosity = benefits = power = numbers = readable = 0
+        
+        for title in titles:
+            features = self._title_features(title)
+            title_lengths.append(features.length)
+            total_words += features.word_count
+            front_loading += features.front_loaded
+            emotional += features.emotional
+            curiosity += features.curiosity
+            benefits += features.benefits
+            power += features.power
+            numbers += features.numbers
+            readable += features.readable
+        
+        total = len(titles)
+        
+        sorted_title_lengths = sorted(title_lengths)  # 중앙값과 길이 분포에서 공유
         
         # Backlinko 기준 분석
         analysis = {
             'basic_stats': {
-                'avg_length': statistics.mean(title_lengths),
-                'median_length': statistics.median(title_lengths),
-                'avg_word_count': statistics.mean(word_counts),
-                'total_titles': len(titles)
+                'avg_length': statistics.fmean(title_lengths),
+                'median_length': statistics.median(sorted_title_lengths),
+                'avg_word_count': total_words / total,
+                'total_titles': total
             },
             'optimization_scores': {
-                'keyword_front_loading': sum(1 for t in titles if self._has_front_loaded_keywords(t, channel_type)) / len(titles) * 100,
-                'emotional_triggers': sum(1 for t in titles if self._has_emotional_triggers(t)) / len(titles) * 100,
-                'curiosity_gaps': sum(1 for t in titles if self._creates_curiosity_gap(t)) / len(titles) * 100,
-                'specific_benefits': sum(1 for t in titles if self._shows_specific_benefits(t)) / len(titles) * 100,
-                'power_words': sum(1 for t in titles if self._contains_power_words(t)) / len(titles) * 100,
-                'numbers_stats': sum(1 for t in titles if self._contains_numbers_or_stats(t)) / len(titles) * 100
+                'keyword_front_loading': front_loading / total * 100,
+                'emotional_triggers': emotional / total * 100,
+                'curiosity_gaps': curiosity / total * 100,
+                'specific_benefits': benefits / total * 100,
+                'power_words': power / total * 100,
+                'numbers_stats': numbers / total * 100
             },
             'common_patterns': self._identify_title_patterns(titles),
-            'length_distribution': self._analyze_length_distribution(title_lengths),
-            'readability_score': sum(1 for t in titles if self._is_readable_title(t)) / len(titles) * 100
+            'length_distribution': self._analyze_length_distribution(sorted_title_lengths),
+            'readability_score': readable / total * 100
         }
         
         return analysis
     
-    def _analyze_descriptions_advanced(self, videos: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """고급 설명 분석"""
-        descriptions = [v.get('description', '') for v in videos if v.get('description')]
+    def _analyze_descriptions_advanced(self, videos: List[Dict[str, Any]],
+                                       sample_videos: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """고급 설명 분석 (sample_videos가 주어지면 키워드 밀도 샘플을 해당 비디오에서 추출)"""
+        # 설명 목록을 따로 만들지 않고 비디오당 한 번의 순회로 길이/품질/콘텐츠 지표를 함께 집계
+        desc_lengths = []
+        total_hashtags = total_links = total_lines = 0
+        strong_openings = call_to_actions = well_structured = video_summaries = 0
+        density_sample = []
         
-        if not descriptions:
+        for video in videos:
+            desc = video.get('description')
+            if not desc:
+                continue
+            
+            if len(density_sample) < 10:
+                density_sample.append(desc)
+            features = self._description_features(desc)
+            desc_lengths.append(features.length)
+            total_hashtags += features.hashtag_count
+            total_links += features.url_count
+            total_lines += features.line_count
+            strong_openings += features.strong_opening
+            call_to_actions += features.call_to_action
+            well_structured += features.well_structured
+            video_summaries += features.video_summary
+        
+        if not desc_lengths:
             return {'no_descriptions': True}
         
-        desc_lengths = [len(desc) for desc in descriptions]
+        total = len(desc_lengths)
+        if sample_videos is not None:
+            density_sample = [v['description'] for v in sample_videos if v.get('description')][:10]
         
         analysis = {
             'basic_stats': {
-                'avg_length': statistics.mean(desc_lengths),
+                'avg_length': statistics.fmean(desc_lengths),
                 'median_length': statistics.median(desc_lengths),
-                'has_description_ratio': len(descriptions) / len(videos) * 100,
-                'total_with_descriptions': len(descriptions)
+                'has_description_ratio': total / len(videos) * 100,
+                'total_with_descriptions': total
             },
             'quality_scores': {
-                'strong_openings': sum(1 for d in descriptions if self._has_strong_opening_line(d)) / len(descriptions) * 100,
-                'call_to_actions': sum(1 for d in descriptions if self._has_call_to_action(d)) / len(descriptions) * 100,
-                'well_structured': sum(1 for d in descriptions if self._is_well_structured(d)) / len(descriptions) * 100,
-                'video_summaries': sum(1 for d in descriptions if self._contains_video_summary(d)) / len(descriptions) * 100
+                'strong_openings': strong_openings / total * 100,
+                'call_to_actions': call_to_actions / total * 100,
+                'well_structured': well_structured / total * 100,
+                'video_summaries': video_summaries / total * 100
             },
             'content_analysis': {
-                'avg_hashtags': statistics.mean([len(re.findall(r'#\w+', d)) for d in descriptions]),
-                'avg_links': statistics.mean([len(re.findall(r'http[s]?://\S+', d)) for d in descriptions]),
-                'avg_lines': statistics.mean([len(d.split('\n')) for d in descriptions])
+                'avg_hashtags': total_hashtags / total,
+                'avg_links': total_links / total,
+                'avg_lines': total_lines / total
             },
-            'keyword_density_distribution': [self._calculate_keyword_density(d) for d in descriptions[:10]]  # 샘플만
+            'keyword_density_distribution': [self._description_features(d).keyword_density for d in density_sample]  # 샘플만
         }
         
         return analysis
     
-    def _analyze_engagement_advanced(self, videos: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_engagement_advanced(self, video_stats: List[_VideoStats]) -> Dict[str, Any]:
         """고급 참여도 분석"""
-        engagement_data = []
-        
-        for video in videos:
-            stats = video.get('statistics', {})
-            view_count = stats.get('view_count', 0)
-            
-            if view_count > 0:
-                engagement_data.append({
-                    'view_count': view_count,
-                    'like_ratio': (stats.get('like_count', 0) / view_count) * 100,
-                    'comment_ratio': (stats.get('comment_count', 0) / view_count) * 100,
-                    'total_engagement': ((stats.get('like_count', 0) + stats.get('comment_count', 0)) / view_count) * 100
-                })
-        
-        if not engagement_data:
+        # 비디오별 딕셔너리 대신 지표별 비율 리스트만 유지
+        like_ratios = []
+        comment_ratios = []
+        total_engagements = []
+        
+        for stats in video_stats:
+            if stats.view_count > 0:
+                like_ratios.append(stats.like_ratio)
+                comment_ratios.append(stats.comment_ratio)
+                total_engagements.append(stats.total_engagement)
+        
+        if not total_engagements:
             return {'no_engagement_data': True}
         
+        low_count, medium_count, high_count = _bucket_counts(total_engagements, [1.0, 3.0])
+        
         analysis = {
             'average_metrics': {
-                'avg_like_ratio': statistics.mean([e['like_ratio'] for e in engagement_data]),
-                'avg_comment_ratio': statistics.mean([e['comment_ratio'] for e in engagement_data]),
-                'avg_total_engagement': statistics.mean([e['total_engagement'] for e in engagement_data])
+                'avg_like_ratio': statistics.fmean(like_ratios),
+                'avg_comment_ratio': statistics.fmean(comment_ratios),
+                'avg_total_engagement': statistics.fmean(total_engagements)
             },
             'benchmarks': {
                 'excellent_like_ratio': 2.0,    # 2% 이상
@@ -541,9 +956,9 @@ class SEOAnalyzer:
                 'good_comment_ratio': 0.2       # 0.2% 이상
             },
             'distribution': {
-                'high_engagement_videos': len([e for e in engagement_data if e['total_engagement'] >= 3.0]),
-                'medium_engagement_videos': len([e for e in engagement_data if 1.0 <= e['total_engagement'] < 3.0]),
-                'low_engagement_videos': len([e for e in engagement_data if e['total_engagement'] < 1.0])
+                'high_engagement_videos': high_count,
+                'medium_engagement_videos': medium_count,
+                'low_engagement_videos': low_count
             }
         }
         
@@ -551,11 +966,17 @@ class SEOAnalyzer:
     
     def _analyze_metadata(self, videos: List[Dict[str, Any]]) -> Dict[str, Any]:
         """메타데이터 분석"""
+        has_title = has_description = has_duration = 0
+        for video in videos:
+            has_title += bool(video.get('title'))
+            has_description += bool(video.get('description'))
+            has_duration += bool(video.get('duration'))
+        
         analysis = {
             'completeness': {
-                'has_title': sum(1 for v in videos if v.get('title')) / len(videos) * 100,
-                'has_description': sum(1 for v in videos if v.get('description')) / len(videos) * 100,
-                'has_duration': sum(1 for v in videos if v.get('duration')) / len(videos) * 100
+                'has_title': has_title / len(videos) * 100,
+                'has_description': has_description / len(videos) * 100,
+                'has_duration': has_duration / len(videos) * 100
             },
             'upload_patterns': self._analyze_upload_patterns(videos),
             'video_types': self._analyze_video_type_distribution(videos)
@@ -564,168 +985,74 @@ class SEOAnalyzer:
         return analysis
     
     # 헬퍼 메서드들
-    def _has_front_loaded_keywords(self, title: str, channel_type: ChannelType) -> bool:
-        """키워드가 제목 앞쪽에 배치되었는지 확인"""
-        words = title.split()
+    def _has_front_loaded_keywords(self, title_lower: str, channel_type: ChannelType) -> bool:
+        """키워드가 제목 앞쪽에 배치되었는지 확인 (소문자로 변환된 제목을 받음)"""
+        words = title_lower.split()
         if len(words) < 3:
             return False
         
         # 첫 3단어 중에 채널 타입 관련 키워드가 있는지 확인
-        first_three = ' '.join(words[:3]).lower()
+        first_three = ' '.join(words[:3])
         
         # 설정된 키워드 패턴에서 확인
-        for category in ['attention_grabbing', 'question_words', 'trending_words']:
-            korean_keywords = getattr(self.config.keyword_patterns.korean, category, [])
-            english_keywords = getattr(self.config.keyword_patterns.english, category, [])
-            
-            for keyword in korean_keywords + english_keywords:
-                if keyword.lower() in first_three:
-                    return True
-        
-        return False
+        return self._front_loaded_keyword_re.search(first_three) is not None
     
-    def _has_emotional_triggers(self, title: str) -> bool:
-        """감정적 트리거가 있는지 확인"""
-        emotional_words = (
-            self.config.keyword_patterns.korean.emotional_words +
-            self.config.keyword_patterns.english.emotional_words +
-            self.config.keyword_patterns.korean.attention_grabbing +
-            self.config.keyword_patterns.english.attention_grabbing
-        )
-        
-        title_lower = title.lower()
-        return any(word in title_lower for word in emotional_words)
-    
-    def _creates_curiosity_gap(self, title: str) -> bool:
-        """호기심 갭을 생성하는지 확인"""
-        curiosity_indicators = [
-            # 한국어
-            '비밀', '진실', '이유', '방법', '놀라운', '충격', '실제로', '정말', '사실',
-            '몰랐던', '숨겨진', '미공개', '최초', '독점', '내부', '뒤에서',
-            # 영어  
-            'secret', 'truth', 'reason', 'hidden', 'revealed', 'shocking', 
-            'surprising', 'unknown', 'behind', 'real', 'actual'
-        ]
-        
-        title_lower = title.lower()
-        return any(indicator in title_lower for indicator in curiosity_indicators)
+    def _has_emotional_triggers(self, title_lower: str) -> bool:
+        """감정적 트리거가 있는지 확인 (소문자로 변환된 제목을 받음)"""
+        return self._emotional_trigger_re.search(title_lower) is not None
+    
+    def _creates_curiosity_gap(self, title_lower: str) -> bool:
+        """호기심 갭을 생성하는지 확인 (소문자로 변환된 제목을 받음)"""
+        return _CURIOSITY_RE.search(title_lower) is not None
     
     def _shows_specific_benefits(self, title: str) -> bool:
         """구체적인 혜택이나 결과를 제시하는지 확인"""
-        benefit_patterns = [
-            r'\d+분', r'\d+시간', r'\d+일', r'\d+주', r'\d+개월',  # 시간 관련
-            r'\d+%', r'\d+배', r'\d+원', r'\d+만원',              # 수치 관련
-            r'\d+가지', r'\d+개', r'\d+번',                      # 개수 관련
-        ]
-        
-        for pattern in benefit_patterns:
-            if re.search(pattern, title):
-                return True
-                
-        return False
+        return _BENEFIT_RE.search(title) is not None
     
-    def _contains_power_words(self, title: str) -> bool:
-        """파워 워드가 포함되어 있는지 확인"""
-        power_words = [
-            # 한국어 (2024 트렌드 반영)
-            '완벽', '최고', '최상', '프리미엄', '고급', '전문', '마스터', '프로',
-            '보장', '확실', '검증', '인증', '공식', '정식', '정품', '신뢰',
-            '혁신', '혁명', '획기적', '새로운', '최신', '업데이트', '개선',
-            '꿀템', '신박', '갓생', '핫플', '존맛', '킹받', '띵작', '실화',
-            # 영어 (2024 트렌드 반영)
-            'ultimate', 'best', 'premium', 'professional', 'master', 'expert',
-            'guaranteed', 'proven', 'certified', 'official', 'authentic',
-            'revolutionary', 'innovative', 'breakthrough', 'advanced',
-            'viral', 'trending', 'game-changer', 'mind-blowing', 'epic'
-        ]
-        
-        title_lower = title.lower()
-        return any(word in title_lower for word in power_words)
+    def _contains_power_words(self, title_lower: str) -> bool:
+        """파워 워드가 포함되어 있는지 확인 (소문자로 변환된 제목을 받음)"""
+        return _POWER_WORDS_RE.search(title_lower) is not None
     
     def _contains_numbers_or_stats(self, title: str) -> bool:
         """숫자나 통계가 포함되어 있는지 확인"""
-        return bool(re.search(r'\d+', title))
+        return _DIGIT_RE.search(title) is not None
     
     def _is_excessive_clickbait(self, title: str) -> bool:
         """과도한 클릭베이트인지 확인"""
-        clickbait_indicators = [
-            '!!!', '???', '대박!!!', '충격!!!', '실화???',
-            '클릭', '누르면', '보면', '절대', '무조건'
-        ]
-        
-        excessive_count = sum(1 for indicator in clickbait_indicators if indicator in title)
-        return excessive_count >= 2
+        return _is_excessive_clickbait(title)
     
     def _is_readable_title(self, title: str) -> bool:
         """제목의 가독성 확인"""
-        # 너무 길거나 짧지 않고, 적절한 구두점 사용
-        if len(title) < 10 or len(title) > 100:
-            return False
-        
-        # 과도한 특수문자 사용 확인
-        special_char_ratio = len(re.findall(r'[!@#$%^&*()_+\-=\[\]{};\':"\\|,.<>\?]', title)) / len(title)
-        if special_char_ratio > 0.3:
-            return False
-        
-        return True
+        return _is_readable_title(title)
     
-    def _guess_video_type_from_title(self, title: str) -> str:
-        """제목으로부터 비디오 타입 추정"""
-        title_lower = title.lower()
-        
-        shorts_indicators = ['shorts', 'short', '짧은', '1분', '30초', '#shorts']
-        live_indicators = ['live', '라이브', '생방송', 'stream']
-        
-        if any(indicator in title_lower for indicator in shorts_indicators):
-            return 'shorts'
-        elif any(indicator in title_lower for indicator in live_indicators):
-            return 'live'
-        else:
-            return 'regular'
+    def _guess_video_type_from_title(self, title_lower: str) -> str:
+        """제목으로부터 비디오 타입 추정 (소문자로 변환된 제목을 받음)"""
+        return _guess_video_type(title_lower)
     
     def _has_strong_opening_line(self, description: str) -> bool:
         """강력한 오프닝 라인이 있는지 확인"""
         if not description:
             return False
         
-        first_line = description.split('\n')[0]
+        first_line = description.partition('\n')[0]
         
         # 첫 줄이 너무 짧거나 길면 안됨
         if len(first_line) < 20 or len(first_line) > 150:
             return False
         
         # 훅 요소들 확인
-        hook_elements = [
-            '궁금', '놀라운', '충격', '비밀', '진실', '실제', '정말',
-            'amazing', 'shocking', 'incredible', 'secret', 'truth'
-        ]
-        
-        return any(element in first_line.lower() for element in hook_elements)
+        return _HOOK_ELEMENT_RE.search(first_line.lower()) is not None
     
     def _calculate_keyword_density(self, text: str) -> float:
         """키워드 밀도 계산 (단순화된 버전)"""
         if not text:
             return 0
         
-        words = text.split()
-        if len(words) < 10:
-            return 0
-        
-        # 주요 키워드들의 출현 빈도 계산 (실제로는 더 정교한 키워드 분석 필요)
-        common_keywords = ['유튜브', 'youtube', '영상', 'video', '채널', 'channel']
-        keyword_count = sum(1 for word in words if word.lower() in common_keywords)
-        
-        return (keyword_count / len(words)) * 100
+        return _keyword_density(text.lower().split())
     
-    def _has_call_to_action(self, description: str) -> bool:
-        """행동 유도 문구가 있는지 확인"""
-        cta_phrases = [
-            '구독', '좋아요', '댓글', '공유', '알림', '클릭', '시청',
-            'subscribe', 'like', 'comment', 'share', 'bell', 'click', 'watch'
-        ]
-        
-        description_lower = description.lower()
-        return any(phrase in description_lower for phrase in cta_phrases)
+    def _has_call_to_action(self, description_lower: str) -> bool:
+        """행동 유도 문구가 있는지 확인 (소문자로 변환된 설명을 받음)"""
+        return _CTA_RE.search(description_lower) is not None
     
     def _is_well_structured(self, description: str) -> bool:
         """잘 구조화된 설명인지 확인"""
@@ -740,41 +1067,21 @@ class SEOAnalyzer:
         
         return empty_lines >= 1 and len(lines) >= 5
     
-    def _contains_video_summary(self, description: str) -> bool:
-        """영상 요약이 포함되어 있는지 확인"""
-        summary_indicators = [
-            '요약', '정리', '핵심', '포인트', '내용', '개요',
-            'summary', 'overview', 'key points', 'highlights'
-        ]
-        
-        description_lower = description.lower()
-        return any(indicator in description_lower for indicator in summary_indicators)
+    def _contains_video_summary(self, description_lower: str) -> bool:
+        """영상 요약이 포함되어 있는지 확인 (소문자로 변환된 설명을 받음)"""
+        return _SUMMARY_RE.search(description_lower) is not None
     
     def _parse_duration(self, duration_str: str) -> int:
         """ISO 8601 duration을 초로 변환"""
-        if not duration_str:
-            return 0
-        
-        try:
-            # PT1H2M30S 형태 파싱
-            match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', duration_str)
-            if match:
-                hours = int(match.group(1) or 0)
-                minutes = int(match.group(2) or 0)
-                seconds = int(match.group(3) or 0)
-                return hours * 3600 + minutes * 60 + seconds
-        except:
-            pass
-        
-        return 0
+        return _duration_seconds(duration_str)
     
     def _detect_channel_type(self, videos: List[Dict[str, Any]]) -> ChannelType:
         """채널 타입 감지"""
         all_titles = ' '.join([video.get('title', '') for video in videos]).lower()
         
-        scores = {}
-        for channel_type, keywords in self.config.channel_detection_keywords.items():
-            scores[channel_type] = sum(1 for keyword in keywords if keyword in all_titles)
+        # 설정 순서를 유지해 동점일 때 기존과 같은 타입 선택
+        scores = Counter(dict.fromkeys(self.config.channel_detection_keywords, 0))
+        scores.update(channel_type for keyword, channel_type in self._channel_type_keywords if keyword in all_titles)
         
         if scores and max(scores.values()) > 0:
             return max(scores, key=scores.get)
@@ -800,18 +1107,20 @@ class SEOAnalyzer:
     
     def _analyze_score_distribution(self, video_scores: List[Dict[str, Any]]) -> Dict[str, Any]:
         """SEO 점수 분포 분석"""
-        scores = [v['seo_score'] for v in video_scores]
+        # 한 번 정렬해 중앙값, 최소/최대, 구간별 개수를 모두 정렬된 목록에서 얻음
+        scores = sorted(v['seo_score'] for v in video_scores)
+        poor, average, good, excellent = _sorted_bucket_counts(scores, [40, 60, 80])
         
         return {
-            'avg_score': statistics.mean(scores),
+            'avg_score': statistics.fmean(scores),
             'median_score': statistics.median(scores),
-            'min_score': min(scores),
-            'max_score': max(scores),
+            'min_score': scores[0],
+            'max_score': scores[-1],
             'score_ranges': {
-                'excellent': len([s for s in scores if s >= 80]),
-                'good': len([s for s in scores if 60 <= s < 80]),
-                'average': len([s for s in scores if 40 <= s < 60]),
-                'poor': len([s for s in scores if s < 40])
+                'excellent': excellent,
+                'good': good,
+                'average': average,
+                'poor': poor
             }
         }
     
@@ -925,24 +1234,36 @@ class SEOAnalyzer:
     
     def _identify_title_patterns(self, titles: List[str]) -> Dict[str, Any]:
         """제목 패턴 식별"""
+        # 패턴별 리스트를 만들지 않고 제목당 한 번의 순회로 개수만 집계
+        how_to = list_format = question = vs_comparison = year_specific = 0
+        
+        for title in titles:
+            title_lower = title.lower()
+            how_to += _HOW_TO_RE.search(title_lower) is not None
+            list_format += _LIST_FORMAT_RE.search(title_lower) is not None
+            question += title.endswith('?') or _QUESTION_WORD_RE.search(title) is not None
+            vs_comparison += ' vs ' in title_lower or ' 대 ' in title or '비교' in title
+            year_specific += _YEAR_RE.search(title) is not None
+        
         patterns = {
-            'how_to_format': len([t for t in titles if any(word in t.lower() for word in ['how to', '어떻게', '방법'])]),
-            'list_format': len([t for t in titles if re.search(r'\d+.*가지|\d+.*things|\d+.*ways', t.lower())]),
-            'question_format': len([t for t in titles if t.endswith('?') or any(word in t for word in ['왜', '무엇', '언제'])]),
-            'vs_comparison': len([t for t in titles if ' vs ' in t.lower() or ' 대 ' in t or '비교' in t]),
-            'year_specific': len([t for t in titles if re.search(r'20\d{2}', t)])
+            'how_to_format': how_to,
+            'list_format': list_format,
+            'question_format': question,
+            'vs_comparison': vs_comparison,
+            'year_specific': year_specific
         }
         
         return patterns
     
-    def _analyze_length_distribution(self, lengths: List[int]) -> Dict[str, int]:
-        """길이 분포 분석"""
+    def _analyze_length_distribution(self, sorted_lengths: List[int]) -> Dict[str, int]:
+        """길이 분포 분석 (정렬된 길이 목록을 받음)"""
+        very_short, short, optimal, long, very_long = _sorted_bucket_counts(sorted_lengths, [30, 50, 70, 100])
         return {
-            'very_short': len([l for l in lengths if l < 30]),    # 매우 짧음
-            'short': len([l for l in lengths if 30 <= l < 50]),   # 짧음
-            'optimal': len([l for l in lengths if 50 <= l < 70]), # 최적
-            'long': len([l for l in lengths if 70 <= l < 100]),   # 김
-            'very_long': len([l for l in lengths if l >= 100])    # 매우 김
+            'very_short': very_short,    # 매우 짧음 (< 30)
+            'short': short,              # 짧음 (30-49)
+            'optimal': optimal,          # 최적 (50-69)
+            'long': long,                # 김 (70-99)
+            'very_long': very_long       # 매우 김 (>= 100)
         }
     
     def _analyze_upload_patterns(self, videos: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -953,8 +1274,7 @@ class SEOAnalyzer:
             try:
                 published_at = video.get('published_at', '')
                 if published_at:
-                    dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                    upload_dates.append(dt)
+                    upload_dates.append(_parse_published_at(published_at))
             except:
                 continue
         
@@ -969,7 +1289,7 @@ class SEOAnalyzer:
             intervals.append(interval)
         
         return {
-            'avg_interval_days': statistics.mean(intervals) if intervals else 0,
+            'avg_interval_days': statistics.fmean(intervals) if intervals else 0,
             'most_active_hour': Counter([dt.hour for dt in upload_dates]).most_common(1)[0] if upload_dates else (0, 0),
             'most_active_day': Counter([dt.weekday() for dt in upload_dates]).most_common(1)[0] if upload_dates else (0, 0),
             'consistency_score': self._calculate_consistency_score(intervals)
@@ -985,7 +1305,7 @@ class SEOAnalyzer:
             return 50
         
         std_dev = statistics.stdev(intervals)
-        avg_interval = statistics.mean(intervals)
+        avg_interval = statistics.fmean(intervals)
         
         # 변동계수 계산 (표준편차/평균)
         cv = std_dev / avg_interval if avg_interval > 0 else 1
@@ -1000,7 +1320,6 @@ class SEOAnalyzer:
         distribution = {'shorts': 0, 'regular': 0, 'live': 0}
         
         for video in videos:
-            video_type = self._guess_video_type_from_title(video.get('title', ''))
-            distribution[video_type] += 1
+            distribution[self._title_features(video.get('title', '')).video_type] += 1
         
         return distribution
\ No newline at end of file
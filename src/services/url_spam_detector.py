@@ -7,6 +7,40 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 닉네임/댓글 조합 분석용 정규식 (모듈 로드 시 한 번만 컴파일)
+_CHANNEL_NICKNAME_RE = re.compile(r'체?널', re.IGNORECASE)
+_ADULT_NICKNAME_RE = re.compile(r'19금|l9금', re.IGNORECASE)
+_SINGLE_CHAR_SUFFIX_RE = re.compile(r'-[a-zA-Z]$')
+_CONSONANT_RE = re.compile(r'[ㄱ-ㅎ]{2,}')
+_WORD_RE = re.compile(r'\w+')
+_REPEATED_CHAR_RE = re.compile(r'(.)\1{3,}')
+_EMOJI_CHAR_RE = re.compile(r'[😀-🿿]')
+_UPPERCASE_RE = re.compile(r'[A-Z]')
+
+# 닉네임/댓글 조합 분석용 키워드
+_PROMOTION_KEYWORDS = ('기억해주세요', '꼭 기억', '잊지 말아', '기억하고', '꼭 잊지')
+_SUSPICIOUS_NICKNAME_KEYWORDS = ('DOPAMIN', 'HIGH', 'NEW', 'PAIMIUM', '레드', '다크', '클릭', 'ON팬', '사건')
+_ADULT_SLANG_KEYWORDS = ('상남자', '선물ㄱㄱ', '핵불닭맛', '걸..ㄹ', '난리났던')
+
+
+def _compile_union(patterns: List[str]) -> 're.Pattern':
+    """패턴 목록을 하나의 대체(|) 정규식으로 합침 (하나라도 매칭되는지 한 번의 스캔으로 확인)"""
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+
+
+def _compile_keyword_union(keywords: List[str]) -> 're.Pattern':
+    """키워드 목록을 리터럴 대체 정규식 하나로 합침 (키워드가 하나라도 포함되는지 한 번에 확인)"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords) or r'(?!)')
+
+
+def _strip_wildcards(pattern: str) -> str:
+    """search에서 의미 없는 앞뒤 '.*' 제거 (매칭 여부는 같고 역추적만 줄어듦)"""
+    if pattern.startswith('.*'):
+        pattern = pattern[2:]
+    if pattern.endswith('.*') and not pattern.endswith('\\.*'):
+        pattern = pattern[:-2]
+    return pattern
+
 
 class URLSpamDetector:
     """댓글 내 URL 및 스팸 패턴 탐지"""
@@ -110,14 +144,37 @@ class URLSpamDetector:
             r'.*사건.*',
             r'.*l9.*ON.*',  # l9와 ON이 함께 있는 경우
         ]
+        
+        # 패턴을 호출마다 re 캐시에서 찾지 않도록 미리 컴파일하고, 패턴 그룹별 합친 정규식으로
+        # 매칭 가능성을 한 번에 확인 (대부분의 댓글/닉네임은 어떤 패턴에도 걸리지 않음)
+        self._url_res = [re.compile(pattern, re.IGNORECASE) for pattern in self.url_patterns]
+        self._any_url_re = _compile_union(self.url_patterns)
+        self._youtube_res = [
+            (re.compile(pattern, re.IGNORECASE), self._get_youtube_type(pattern))
+            for pattern in self.youtube_patterns
+        ]
+        self._any_youtube_re = _compile_union(self.youtube_patterns)
+        self._nickname_res = [
+            (pattern, re.compile(_strip_wildcards(pattern), re.IGNORECASE))
+            for pattern in self.suspicious_nickname_patterns
+        ]
+        self._any_nickname_re = _compile_union([_strip_wildcards(p) for p in self.suspicious_nickname_patterns])
+        # 전체 카테고리 키워드 합집합 (키워드가 하나도 없는 텍스트는 카테고리별 검사 생략)
+        self._any_keyword_re = _compile_keyword_union([
+            keyword
+            for config in self.suspicious_patterns.values()
+            for keyword in config['keywords']
+        ])
     
     def extract_urls(self, text: str) -> List[Dict[str, Any]]:
         """텍스트에서 URL 추출"""
         urls = []
+        if self._any_url_re.search(text) is None:
+            return urls
         
-        for pattern in self.url_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        # 패턴별 매칭은 서로 겹칠 수 있으므로 (같은 URL이 여러 패턴에 걸림) 패턴마다 따로 수집
+        for url_re in self._url_res:
+            for match in url_re.finditer(text):
                 url = match.group(0).strip()
                 if url:
                     urls.append({
@@ -132,14 +189,15 @@ class URLSpamDetector:
     def extract_youtube_info(self, text: str) -> List[Dict[str, Any]]:
         """유튜브 채널/비디오 정보 추출"""
         youtube_info = []
+        if self._any_youtube_re.search(text) is None:
+            return youtube_info
         
-        for pattern in self.youtube_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for youtube_re, youtube_type in self._youtube_res:
+            for match in youtube_re.finditer(text):
                 youtube_info.append({
                     'full_match': match.group(0),
                     'identifier': match.group(1) if match.groups() else None,
-                    'type': self._get_youtube_type(pattern),
+                    'type': youtube_type,
                     'start': match.start(),
                     'end': match.end()
                 })
@@ -165,11 +223,12 @@ class URLSpamDetector:
         suspicion_score = 0
         detected_patterns = []
         
-        # 의심스러운 닉네임 패턴 체크
-        for pattern in self.suspicious_nickname_patterns:
-            if re.search(pattern, nickname, re.IGNORECASE):
-                suspicion_score += 2
-                detected_patterns.append(pattern)
+        # 의심스러운 닉네임 패턴 체크 (합친 정규식에 걸릴 때만 패턴별 확인)
+        if self._any_nickname_re.search(nickname) is not None:
+            for pattern, nickname_re in self._nickname_res:
+                if nickname_re.search(nickname):
+                    suspicion_score += 2
+                    detected_patterns.append(pattern)
         
         # URL이 포함된 닉네임 체크
         nickname_urls = self.extract_urls(nickname)
@@ -203,6 +262,10 @@ class URLSpamDetector:
                 'risk_score': 0
             }
             
+            # URL 주변 텍스트는 URL당 한 번만 소문자로 변환하고, 키워드가 하나도 없으면 키워드 체크 생략
+            text_around_url = comment_text[max(0, url_info['start']-50):url_info['end']+50].lower()
+            has_keywords = self._any_keyword_re.search(text_around_url) is not None
+            
             # 카테고리별 위험도 체크
             for category, config in self.suspicious_patterns.items():
                 category_risk = 0
@@ -213,12 +276,12 @@ class URLSpamDetector:
                     url_risk['categories'].append(category)
                 
                 # 키워드 체크 (URL 주변 텍스트)
-                text_around_url = comment_text[max(0, url_info['start']-50):url_info['end']+50]
-                for keyword in config['keywords']:
-                    if keyword in text_around_url.lower():
-                        category_risk += config['risk_score'] * 0.5
-                        if category not in url_risk['categories']:
-                            url_risk['categories'].append(category)
+                if has_keywords:
+                    for keyword in config['keywords']:
+                        if keyword in text_around_url:
+                            category_risk += config['risk_score'] * 0.5
+                            if category not in url_risk['categories']:
+                                url_risk['categories'].append(category)
                 
                 url_risk['risk_score'] += category_risk
             
@@ -251,6 +314,13 @@ class URLSpamDetector:
         total_risk = 0
         detected_categories = []
         
+        # 대부분의 댓글에는 의심 키워드가 없으므로 합친 정규식 한 번으로 먼저 확인
+        if self._any_keyword_re.search(text_lower) is None:
+            return {
+                'risk_score': total_risk,
+                'categories': detected_categories
+            }
+        
         for category, config in self.suspicious_patterns.items():
             category_score = 0
             detected_keywords = []
@@ -286,45 +356,42 @@ class URLSpamDetector:
         detected_patterns = []
         
         # 닉네임에 채널/체널이 있고 댓글에 프로모션 키워드가 있는 경우
-        if re.search(r'.*체?널.*', nickname, re.IGNORECASE):
-            promotion_keywords = ['기억해주세요', '꼭 기억', '잊지 말아', '기억하고', '꼭 잊지']
-            for keyword in promotion_keywords:
+        if _CHANNEL_NICKNAME_RE.search(nickname):
+            for keyword in _PROMOTION_KEYWORDS:
                 if keyword in comment_text:
                     combination_score += 8
                     detected_patterns.append(f'channel_name_with_promotion: {keyword}')
         
         # 닉네임에 19금/l9금이 있는 경우
-        if re.search(r'.*(19금|l9금).*', nickname, re.IGNORECASE):
+        if _ADULT_NICKNAME_RE.search(nickname):
             combination_score += 10
             detected_patterns.append('adult_content_in_nickname')
         
         # 닉네임에 특정 키워드 조합이 있는 경우 (DOPAMIN, HIGH, NEW 등)
-        suspicious_keywords = ['DOPAMIN', 'HIGH', 'NEW', 'PAIMIUM', '레드', '다크', '클릭', 'ON팬', '사건']
         nickname_upper = nickname.upper()
-        keyword_count = sum(1 for keyword in suspicious_keywords if keyword in nickname_upper)
+        keyword_count = sum(1 for keyword in _SUSPICIOUS_NICKNAME_KEYWORDS if keyword in nickname_upper)
         if keyword_count >= 2:
             combination_score += 6
             detected_patterns.append(f'multiple_suspicious_keywords: {keyword_count}')
         
         # 닉네임에 하이픈이 3개 이상 있는 경우 (클릭-l9-ON팬NEW사건-t 패턴)
-        if len(re.findall(r'-', nickname)) >= 3:
+        if nickname.count('-') >= 3:
             combination_score += 5
             detected_patterns.append('multiple_hyphens_in_nickname')
         
         # 닉네임 끝에 단일 문자가 있는 경우 (봇 패턴)
-        if re.search(r'.*-[a-zA-Z]$', nickname):
+        if _SINGLE_CHAR_SUFFIX_RE.search(nickname):
             combination_score += 4
             detected_patterns.append('single_char_suffix')
         
         # 댓글에 성인 슬랭이 있는 경우
-        adult_slang_keywords = ['상남자', '선물ㄱㄱ', '핵불닭맛', '걸..ㄹ', '난리났던']
-        for slang in adult_slang_keywords:
+        for slang in _ADULT_SLANG_KEYWORDS:
             if slang in comment_text:
                 combination_score += 6
                 detected_patterns.append(f'adult_slang_detected: {slang}')
         
         # 자음만 있는 텍스트 패턴 (ㄱㄱ, ㄹㅇ 등)
-        consonant_pattern = re.findall(r'[ㄱ-ㅎ]{2,}', comment_text)
+        consonant_pattern = _CONSONANT_RE.findall(comment_text)
         if consonant_pattern:
             combination_score += 3
             detected_patterns.append(f'consonant_pattern: {consonant_pattern}')
@@ -335,8 +402,8 @@ class URLSpamDetector:
             detected_patterns.append('emoji_spam_start')
         
         # 닉네임과 댓글 내용이 너무 유사한 경우
-        nickname_words = set(re.findall(r'\w+', nickname.lower()))
-        comment_words = set(re.findall(r'\w+', comment_text.lower()))
+        nickname_words = set(_WORD_RE.findall(nickname.lower()))
+        comment_words = set(_WORD_RE.findall(comment_text.lower()))
         if len(nickname_words) > 0:
             overlap_ratio = len(nickname_words & comment_words) / len(nickname_words)
             if overlap_ratio > 0.5:
@@ -394,9 +461,9 @@ class URLSpamDetector:
     def _analyze_additional_patterns(self, comment_text: str, author_name: str) -> Dict[str, Any]:
         """추가 패턴 분석"""
         patterns = {
-            'repeated_chars': len(re.findall(r'(.)\1{3,}', comment_text)) > 0,  # 같은 문자 4번 이상 반복
-            'excessive_emojis': len(re.findall(r'[😀-🿿]', comment_text)) > 5,  # 이모지 5개 이상
-            'caps_lock_heavy': len(re.findall(r'[A-Z]', comment_text)) > len(comment_text) * 0.5,  # 대문자 50% 이상
+            'repeated_chars': _REPEATED_CHAR_RE.search(comment_text) is not None,  # 같은 문자 4번 이상 반복
+            'excessive_emojis': len(_EMOJI_CHAR_RE.findall(comment_text)) > 5,  # 이모지 5개 이상
+            'caps_lock_heavy': len(_UPPERCASE_RE.findall(comment_text)) > len(comment_text) * 0.5,  # 대문자 50% 이상
             'promotional_phrases': any(phrase in comment_text.lower() for phrase in [
                 '구독하고', '좋아요하고', '팔로우하고', '내 채널', '제 채널'
             ]),
@@ -1,19 +1,48 @@
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
+import asyncio
 import logging
+import threading
 from src.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# googleapiclient 동기 호출 전용 스레드 풀 (이벤트 루프 차단 방지, 크기는 Google API 동시 요청 상한과 동일)
+_YOUTUBE_API_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.GOOGLE_MAX_CONCURRENCY,
+    thread_name_prefix='youtube-data-api'
+)
+
+# httplib2.Http는 스레드 안전하지 않아 작업 스레드별로 연결을 따로 사용
+_thread_local = threading.local()
+
+
+def _thread_http():
+    """현재 스레드의 httplib2.Http 반환 (스레드 안에서는 연결 재사용)"""
+    http = getattr(_thread_local, 'http', None)
+    if http is None:
+        http = _thread_local.http = build_http()
+    return http
+
+
+def _execute_request(request) -> Dict[str, Any]:
+    """googleapiclient 요청을 현재 스레드의 연결로 실행 (API 키는 요청 URI에 포함됨)"""
+    return request.execute(http=_thread_http())
+
+
 class YouTubeDataAPIService:
     """YouTube Data API v3 서비스 클래스"""
     
-    def __init__(self):
+    def __init__(self, max_concurrent_requests: Optional[int] = None):
         self.api_key = settings.YOUTUBE_API_KEY
         self.service_name = settings.YOUTUBE_API_SERVICE_NAME
         self.version = settings.YOUTUBE_API_VERSION
         self._service = None
+        # 실행 중인 API 요청 수 상한 (지정하지 않으면 스레드 풀 크기만큼 동시 실행)
+        self._request_semaphore = asyncio.Semaphore(max_concurrent_requests) if max_concurrent_requests else None
         
         # Debug: API 키 상태 로깅 (보안을 위해 일부만 표시)
         if self.api_key:
@@ -41,6 +70,14 @@ class YouTubeDataAPIService:
         
         return self._service
     
+    async def _execute(self, request) -> Dict[str, Any]:
+        """googleapiclient 요청을 전용 스레드 풀에서 실행합니다 (대기 중 다른 코루틴 진행)."""
+        loop = asyncio.get_running_loop()
+        if self._request_semaphore is None:
+            return await loop.run_in_executor(_YOUTUBE_API_EXECUTOR, _execute_request, request)
+        async with self._request_semaphore:
+            return await loop.run_in_executor(_YOUTUBE_API_EXECUTOR, _execute_request, request)
+    
     def _extract_channel_info_from_url(self, url: str) -> Dict[str, str]:
         """YouTube URL에서 채널 정보를 추출합니다."""
         import re
@@ -115,7 +152,7 @@ class YouTubeDataAPIService:
             
             # API 호출
             request = service.channels().list(**params)
-            response = request.execute()
+            response = await self._execute(request)
             
             if not response.get('items'):
                 return {
@@ -199,6 +236,63 @@ class YouTubeDataAPIService:
             }
         }
     
+    async def get_channels_info(self, channel_ids: List[str]) -> Dict[str, Any]:
+        """
+        여러 채널 정보를 일괄 조회합니다.
+        
+        Args:
+            channel_ids: 채널 ID 목록 (50개씩 나누어 channels.list 호출)
+        
+        Returns:
+            요청 순서대로 정렬된 채널 정보 목록 (찾지 못한 채널은 제외)
+        """
+        try:
+            service = self._get_service()
+            
+            # 순서를 유지하며 중복 제거
+            unique_ids = list(dict.fromkeys(channel_ids))
+            channels_by_id = {}
+            
+            # YouTube API v3 제한: channels().list()는 최대 50개 ID만 허용
+            batch_size = 50
+            for i in range(0, len(unique_ids), batch_size):
+                batch_ids = unique_ids[i:i + batch_size]
+                
+                response = await self._execute(service.channels().list(
+                    part='snippet,statistics,brandingSettings,status,topicDetails',
+                    id=','.join(batch_ids),
+                    maxResults=batch_size
+                ))
+                
+                for item in response.get('items', []):
+                    channel_info = self._process_channel_data(item)
+                    channels_by_id[channel_info['channel_id']] = channel_info
+            
+            channels = [channels_by_id[channel_id] for channel_id in unique_ids if channel_id in channels_by_id]
+            
+            return {
+                'success': True,
+                'message': f'Retrieved {len(channels)} channels',
+                'data': {
+                    'channels': channels
+                }
+            }
+            
+        except HttpError as e:
+            logger.error(f"YouTube API HTTP Error: {str(e)}")
+            return {
+                'success': False,
+                'message': f'YouTube API Error: {e.error_details[0]["message"] if e.error_details else str(e)}',
+                'data': None
+            }
+        except Exception as e:
+            logger.error(f"Error getting channels info: {str(e)}")
+            return {
+                'success': False,
+                'message': f'Internal error: {str(e)}',
+                'data': None
+            }
+    
     async def get_channel_videos(self, channel_id: str, max_results: int = 50, order: str = 'date', page_token: str = None) -> Dict[str, Any]:
         """
         채널의 비디오 목록을 조회합니다.
@@ -215,10 +309,10 @@ class YouTubeDataAPIService:
             service = self._get_service()
             
             # 채널의 업로드 플레이리스트 ID 가져오기
-            channels_response = service.channels().list(
+            channels_response = await self._execute(service.channels().list(
                 part='contentDetails',
                 id=channel_id
-            ).execute()
+            ))
             
             if not channels_response.get('items'):
                 return {
@@ -230,7 +324,6 @@ class YouTubeDataAPIService:
             uploads_playlist_id = channels_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
             
             videos = []
-            video_ids = []
             all_videos = []
             current_page_token = page_token
             videos_fetched = 0
@@ -249,7 +342,7 @@ class YouTubeDataAPIService:
                 if current_page_token:
                     params['pageToken'] = current_page_token
                     
-                playlist_response = service.playlistItems().list(**params).execute()
+                playlist_response = await self._execute(service.playlistItems().list(**params))
                 items = playlist_response.get('items', [])
                 
                 if not items:
@@ -259,7 +352,6 @@ class YouTubeDataAPIService:
                 for item in items:
                     video_info = self._process_video_data(item)
                     videos.append(video_info)
-                    video_ids.append(video_info['video_id'])
                 
                 videos_fetched += len(items)
                 current_page_token = playlist_response.get('nextPageToken')
@@ -269,31 +361,7 @@ class YouTubeDataAPIService:
                     break
             
             # 비디오 ID들로 통계 정보 일괄 조회 (50개씩 배치 처리)
-            stats_map = {}
-            if video_ids:
-                # YouTube API v3 제한: videos().list()는 최대 50개 ID만 허용
-                batch_size = 50
-                for i in range(0, len(video_ids), batch_size):
-                    batch_video_ids = video_ids[i:i + batch_size]
-                    
-                    stats_response = service.videos().list(
-                        part='statistics',
-                        id=','.join(batch_video_ids)
-                    ).execute()
-                    
-                    # 통계 정보를 맵에 추가
-                    for stats_item in stats_response.get('items', []):
-                        stats_map[stats_item['id']] = stats_item.get('statistics', {})
-                
-                for video in videos:
-                    video_id = video['video_id']
-                    if video_id in stats_map:
-                        stats = stats_map[video_id]
-                        video['statistics'] = {
-                            'view_count': int(stats.get('viewCount', 0)),
-                            'like_count': int(stats.get('likeCount', 0)),
-                            'comment_count': int(stats.get('commentCount', 0))
-                        }
+            await self._attach_video_statistics(service, videos)
             
             return {
                 'success': True,
@@ -320,6 +388,115 @@ class YouTubeDataAPIService:
                 'data': None
             }
     
+    async def get_recent_videos_for_channels(self, channel_ids: List[str], per_channel: int = 20) -> Dict[str, Any]:
+        """
+        여러 채널의 최근 비디오를 한 번에 조회합니다.
+        
+        Args:
+            channel_ids: 채널 ID 목록
+            per_channel: 채널당 최대 비디오 수 (최대 50개)
+        
+        Returns:
+            채널 ID별 최근 비디오 목록
+        """
+        try:
+            service = self._get_service()
+            
+            unique_ids = list(dict.fromkeys(channel_ids))
+            per_channel = min(per_channel, 50)
+            batch_size = 50
+            
+            # 1단계: 업로드 플레이리스트 ID 일괄 조회 (50개씩)
+            uploads_playlists = {}
+            for i in range(0, len(unique_ids), batch_size):
+                channels_response = await self._execute(service.channels().list(
+                    part='contentDetails',
+                    id=','.join(unique_ids[i:i + batch_size]),
+                    maxResults=batch_size
+                ))
+                
+                for item in channels_response.get('items', []):
+                    uploads_playlists[item['id']] = item['contentDetails']['relatedPlaylists']['uploads']
+            
+            # 2단계: 채널별 업로드 플레이리스트에서 최근 비디오 수집
+            videos_by_channel = {}
+            all_videos = []
+            for channel_id, playlist_id in uploads_playlists.items():
+                # 한 채널의 실패(삭제된 업로드 플레이리스트 등)가 다른 채널 결과를 버리지 않도록 채널별 처리
+                try:
+                    playlist_response = await self._execute(service.playlistItems().list(
+                        part='snippet,contentDetails',
+                        playlistId=playlist_id,
+                        maxResults=per_channel
+                    ))
+                except HttpError as e:
+                    logger.warning(f"Skipping recent videos for channel {channel_id}: {str(e)}")
+                    continue
+                
+                channel_videos = [self._process_video_data(item) for item in playlist_response.get('items', [])]
+                videos_by_channel[channel_id] = channel_videos
+                all_videos.extend(channel_videos)
+            
+            # 3단계: 모든 채널의 비디오 통계를 50개씩 묶어 조회 (실패해도 수집한 비디오 목록은 반환)
+            try:
+                await self._attach_video_statistics(service, all_videos)
+            except HttpError as e:
+                logger.warning(f"Failed to attach statistics to recent videos: {str(e)}")
+            
+            return {
+                'success': True,
+                'message': f'Retrieved {len(all_videos)} videos for {len(videos_by_channel)} channels',
+                'data': {
+                    'videos_by_channel': videos_by_channel
+                }
+            }
+            
+        except HttpError as e:
+            logger.error(f"YouTube API HTTP Error: {str(e)}")
+            return {
+                'success': False,
+                'message': f'YouTube API Error: {e.error_details[0]["message"] if e.error_details else str(e)}',
+                'data': None
+            }
+        except Exception as e:
+            logger.error(f"Error getting recent videos for channels: {str(e)}")
+            return {
+                'success': False,
+                'message': f'Internal error: {str(e)}',
+                'data': None
+            }
+    
+    async def _attach_video_statistics(self, service, videos: List[Dict[str, Any]]) -> None:
+        """videos.list를 50개씩 호출하여 비디오 목록에 통계 정보를 추가합니다."""
+        video_ids = [video['video_id'] for video in videos if video.get('video_id')]
+        if not video_ids:
+            return
+        
+        stats_map = {}
+        # YouTube API v3 제한: videos().list()는 최대 50개 ID만 허용
+        batch_size = 50
+        for i in range(0, len(video_ids), batch_size):
+            batch_video_ids = video_ids[i:i + batch_size]
+            
+            stats_response = await self._execute(service.videos().list(
+                part='statistics',
+                id=','.join(batch_video_ids)
+            ))
+            
+            # 통계 정보를 맵에 추가
+            for stats_item in stats_response.get('items', []):
+                stats_map[stats_item['id']] = stats_item.get('statistics', {})
+        
+        for video in videos:
+            video_id = video['video_id']
+            if video_id in stats_map:
+                stats = stats_map[video_id]
+                video['statistics'] = {
+                    'view_count': int(stats.get('viewCount', 0)),
+                    'like_count': int(stats.get('likeCount', 0)),
+                    'comment_count': int(stats.get('commentCount', 0))
+                }
+    
     def _process_video_data(self, video_item: Dict) -> Dict[str, Any]:
         """비디오 데이터를 처리하고 정리합니다."""
         snippet = video_item.get('snippet', {})
@@ -355,7 +532,7 @@ class YouTubeDataAPIService:
                 part='snippet,statistics,status,contentDetails',
                 id=video_id
             )
-            response = request.execute()
+            response = await self._execute(request)
             
             if not response.get('items'):
                 return {
@@ -458,7 +635,7 @@ class YouTubeDataAPIService:
                 maxResults=max_results,
                 order='relevance'
             )
-            response = request.execute()
+            response = await self._execute(request)
             
             channels = []
             for item in response.get('items', []):
@@ -514,7 +691,7 @@ class YouTubeDataAPIService:
                 part='snippet',
                 regionCode=region
             )
-            response = request.execute()
+            response = await self._execute(request)
             
             categories = []
             for item in response.get('items', []):
@@ -576,7 +753,7 @@ class YouTubeDataAPIService:
                 order='relevance',
                 regionCode=region
             )
-            response = request.execute()
+            response = await self._execute(request)
             
             channels = []
             for item in response.get('items', []):
@@ -658,7 +835,7 @@ class YouTubeDataAPIService:
                 
                 # API 호출 (quota cost: 1 unit)
                 request = service.commentThreads().list(**params)
-                response = request.execute()
+                response = await self._execute(request)
                 total_quota_used += 1
                 page_count += 1
                 
@@ -828,7 +1005,7 @@ class YouTubeDataAPIService:
                     params['pageToken'] = next_page_token
                 
                 request = service.comments().list(**params)
-                response = request.execute()
+                response = await self._execute(request)
                 
                 for reply_item in response.get('items', []):
                     reply_data = self._process_reply_comment(reply_item, parent_comment_id)
@@ -890,7 +1067,7 @@ class YouTubeDataAPIService:
                 type='video',
                 maxResults=1
             )
-            test_request.execute()
+            await self._execute(test_request)
             
             return {
                 'success': True,
@@ -1,5 +1,6 @@
 """YouTube Reporting API 서비스"""
 
+import heapq
 import httpx
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
@@ -781,8 +782,8 @@ class YouTubeReportingService:
                     'avg_time_in_playlist': avg_time_in_playlist
                 })
             
-            # 성과순 정렬
-            playlists.sort(key=lambda x: x['views'], reverse=True)
+            # 성과순 상위 10개만 선택 (전체 정렬 불필요)
+            top_playlists = heapq.nlargest(10, playlists, key=lambda x: x['views'])
             
             return {
                 'success': True,
@@ -792,7 +793,7 @@ class YouTubeReportingService:
                         'total_starts': total_starts,
                         'avg_views_per_start': round(total_views / total_starts if total_starts > 0 else 0, 2)
                     },
-                    'playlists': playlists[:10],  # 상위 10개만
+                    'playlists': top_playlists,  # 상위 10개만
                     'playlist_count': len(playlists)
                 }
             }
@@ -0,0 +1,105 @@
+import random
+
+import pytest
+from rapidfuzz import fuzz
+
+from src.services.comment_processor import CommentProcessor
+
+@pytest.fixture
+def processor():
+    return CommentProcessor()
+
+def random_comments(rng, count, alphabet, min_length, max_length):
+    """작은 문자 집합으로 서로 비슷한 댓글이 자주 생기도록 무작위 댓글 생성"""
+    return [
+        {
+            'comment_id': str(index),
+            'text': ''.join(rng.choice(alphabet) for _ in range(rng.randint(min_length, max_length))),
+            'author': f'user{index}'
+        }
+        for index in range(count)
+    ]
+
+def brute_force_similar_groups(processor, comments):
+    """모든 그룹 대표와 비교하는 기준 구현 (첫 번째로 기준을 넘는 그룹에 배정)"""
+    groups = []
+    for comment in comments:
+        normalized_text = processor.preprocess_text(comment['text'])
+        for group in groups:
+            representative = processor.preprocess_text(group[0]['text'])
+            if normalized_text and representative and (
+                normalized_text == representative or
+                fuzz.ratio(normalized_text, representative) / 100.0 >= processor.similarity_threshold
+            ):
+                group.append(comment)
+                break
+        else:
+            groups.append([comment])
+    return [group for group in groups if len(group) >= processor.min_duplicate_count]
+
+class TestSimilarDuplicates:
+
+    def test_short_pairs_without_shared_ngrams(self, processor):
+        """n-gram을 공유하지 않아도 기준을 넘는 짧은 댓글 쌍 탐지"""
+        comments = [
+            {'comment_id': '1', 'text': 'abcde', 'author': 'a'},
+            {'comment_id': '2', 'text': 'abXde', 'author': 'b'},
+            {'comment_id': '3', 'text': 'abYde', 'author': 'c'},
+        ]
+        groups = processor.detect_similar_duplicates(comments)
+        assert [[c['comment_id'] for c in group] for group in groups] == [['1', '2', '3']]
+
+    @pytest.mark.parametrize('min_length,max_length', [(1, 3), (2, 7), (8, 12)])
+    def test_matches_brute_force(self, processor, min_length, max_length):
+        """후보 색인을 쓴 그룹핑이 전체 비교 결과와 동일한지 확인"""
+        rng = random.Random(min_length * 100 + max_length)
+        for _ in range(300):
+            comments = random_comments(rng, rng.randint(3, 25), 'abcd가나', min_length, max_length)
+            expected = brute_force_similar_groups(processor, comments)
+            assert processor.detect_similar_duplicates(comments) == expected
+
+class TestReplyPatterns:
+
+    def test_short_reply_copied_from_main_comment(self, processor):
+        """n-gram을 공유하지 않는 짧은 복사 대댓글도 유사 대댓글로 탐지"""
+        comments = [
+            {'comment_id': '1', 'text': 'abcd', 'author': 'a'},
+            {'comment_id': '2', 'text': 'abXcd', 'author': 'b', 'is_reply': True, 'parent_id': '1'},
+        ]
+        details = processor._analyze_reply_patterns(comments)['reply_spam_details']
+        assert [detail['comment_id'] for detail in details] == ['2']
+        assert 'similar_to_main_comment' in details[0]['spam_indicators']
+
+    @pytest.mark.parametrize('min_length,max_length', [(1, 3), (2, 7), (8, 12)])
+    def test_similar_replies_match_brute_force(self, processor, min_length, max_length):
+        """후보 색인을 쓴 유사 대댓글 판정이 전체 비교 결과와 동일한지 확인"""
+        rng = random.Random(min_length * 1000 + max_length)
+        for _ in range(200):
+            comments = random_comments(rng, rng.randint(2, 25), 'abc가', min_length, max_length)
+            for comment in comments:
+                comment['is_reply'] = rng.random() < 0.5
+            
+            regular_texts = [c['text'] for c in comments if not c['is_reply']]
+            expected = {
+                c['comment_id'] for c in comments
+                if c['is_reply'] and any(
+                    processor.calculate_similarity(c['text'], text) > 0.8 for text in regular_texts
+                )
+            }
+            details = processor._analyze_reply_patterns(comments)['reply_spam_details']
+            assert {
+                detail['comment_id'] for detail in details
+                if 'similar_to_main_comment' in detail['spam_indicators']
+            } == expected
+
+class TestSpamPatterns:
+
+    def test_short_words_do_not_crowd_out_common_phrases(self, processor):
+        """더 자주 나오는 2글자 이하 단어가 상위 10개 구문 자리를 차지하지 않는지 확인"""
+        short_words = ' '.join(f'{letter}{letter}' for letter in 'abcdefghijk')
+        comments = [
+            {'comment_id': str(index), 'text': f'{short_words} 구독 free', 'author': f'user{index}'}
+            for index in range(6)
+        ]
+        patterns = processor.analyze_spam_patterns(comments)
+        assert patterns['common_phrases'] == [{'phrase': 'free', 'count': 6}]
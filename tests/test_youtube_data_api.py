@@ -0,0 +1,44 @@
+import asyncio
+import math
+import threading
+import time
+
+import pytest
+
+from src.services.youtube_data_api import YouTubeDataAPIService
+
+REQUEST_LATENCY = 0.2  # 초
+
+class SlowRequest:
+    """실행 중인 요청 수를 기록하는 느린 googleapiclient 요청 대용품"""
+
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def execute(self, http=None):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        time.sleep(REQUEST_LATENCY)
+        with cls.lock:
+            cls.in_flight -= 1
+        return {'items': []}
+
+class TestRequestConcurrency:
+
+    @pytest.mark.asyncio
+    async def test_requests_overlap_up_to_limit(self):
+        """동시 요청 상한만큼 요청이 겹쳐 실행되고 그 이상은 대기하는지 확인"""
+        limit, count = 8, 20
+        service = YouTubeDataAPIService(max_concurrent_requests=limit)
+        SlowRequest.in_flight = SlowRequest.max_in_flight = 0
+
+        started = time.perf_counter()
+        await asyncio.gather(*(service._execute(SlowRequest()) for _ in range(count)))
+        elapsed = time.perf_counter() - started
+
+        assert SlowRequest.max_in_flight == limit
+        # 순차 실행이면 count * latency(4초), 상한 적용 시 ceil(count / limit) * latency(0.6초)
+        assert elapsed == pytest.approx(math.ceil(count / limit) * REQUEST_LATENCY, abs=REQUEST_LATENCY * 0.75)